@@ -0,0 +1,142 @@
+import argparse
+import logging
+import sys
+
+from fastapi import HTTPException
+
+from .services import cascade as cascade_service
+from .services import email_outbox as email_outbox_service
+from .services import pools as pools_service
+from .services import season_stats as season_stats_service
+from .services import seasons as seasons_service
+from .services import user_search as user_search_service
+
+
+def _advance_season(args):
+    report = seasons_service.advance_season_pools(args.season_id, args.week)
+    sys.stdout.write(report.model_dump_json(indent=2) + "\n")
+    return 1 if report.failed_count else 0
+
+
+def _refresh_pick_stats(args):
+    report = season_stats_service.refresh_season_pick_stats()
+    sys.stdout.write(report.model_dump_json(indent=2) + "\n")
+    return 0
+
+
+def _sync_usernames(args):
+    report = pools_service.sync_membership_usernames(args.user_id)
+    sys.stdout.write(report.model_dump_json(indent=2) + "\n")
+    return 0
+
+
+def _rebuild_user_search(args):
+    report = user_search_service.rebuild_user_search_index()
+    sys.stdout.write(report.model_dump_json(indent=2) + "\n")
+    return 0
+
+
+def _check_score_engines(args):
+    report = pools_service.check_score_engine_parity(args.season_id)
+    sys.stdout.write(report.model_dump_json(indent=2) + "\n")
+    return 1 if report.mismatches else 0
+
+
+def _drain_email_outbox(args):
+    report = email_outbox_service.drain_email_outbox(args.batch_size)
+    sys.stdout.write(report.model_dump_json(indent=2) + "\n")
+    return 1 if report.failed else 0
+
+
+def _purge_tombstones(args):
+    report = cascade_service.purge_tombstones(args.batch_size)
+    sys.stdout.write(report.model_dump_json(indent=2) + "\n")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="survivor-pool")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    advance = commands.add_parser(
+        "advance-season",
+        help="Advance every open pool on a season by one week",
+    )
+    advance.add_argument("season_id")
+    advance.add_argument(
+        "--week",
+        type=int,
+        default=None,
+        help="Only advance pools currently on this week",
+    )
+    advance.set_defaults(handler=_advance_season)
+
+    pick_stats = commands.add_parser(
+        "refresh-pick-stats",
+        help="Roll new picks into the season pick stats collection",
+    )
+    pick_stats.set_defaults(handler=_refresh_pick_stats)
+
+    usernames = commands.add_parser(
+        "sync-usernames",
+        help="Copy current usernames onto pool memberships",
+    )
+    usernames.add_argument(
+        "--user-id",
+        default=None,
+        help="Only propagate the username of this user",
+    )
+    usernames.set_defaults(handler=_sync_usernames)
+
+    user_search = commands.add_parser(
+        "rebuild-user-search",
+        help="Backfill username_lower and rebuild the user search grams",
+    )
+    user_search.set_defaults(handler=_rebuild_user_search)
+
+    score_engines = commands.add_parser(
+        "check-score-engines",
+        help="Compare python and aggregate score engines without writing",
+    )
+    score_engines.add_argument("season_id")
+    score_engines.set_defaults(handler=_check_score_engines)
+
+    email_outbox = commands.add_parser(
+        "drain-email-outbox",
+        help="Send one batch of queued verification and reset emails",
+    )
+    email_outbox.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Maximum number of queued emails to claim",
+    )
+    email_outbox.set_defaults(handler=_drain_email_outbox)
+
+    purge = commands.add_parser(
+        "purge-tombstones",
+        help="Delete one batch of rows left behind by deleted pools and users",
+    )
+    purge.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Maximum number of picks and memberships to delete",
+    )
+    purge.set_defaults(handler=_purge_tombstones)
+
+    return parser
+
+
+def main(argv=None):
+    logging.basicConfig(level=logging.INFO)
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except HTTPException as exc:
+        sys.stderr.write(f"{exc.detail}\n")
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,79 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from ..routers import picks, pools, root, seasons, users
+from . import password_pool
 from .config import (
     CORS_ALLOW_CREDENTIALS,
     CORS_ALLOW_HEADERS,
     CORS_ALLOW_METHODS,
     CORS_ALLOW_ORIGIN_REGEX,
+    EMAIL_OUTBOX_BATCH_SIZE,
+    EMAIL_OUTBOX_POLL_SECONDS,
+    EMAIL_OUTBOX_WORKER_ENABLED,
+    POOL_SCHEDULER_CONCURRENCY,
+    POOL_SCHEDULER_ENABLED,
+    POOL_SCHEDULER_LEASE_SECONDS,
+    POOL_SCHEDULER_MAX_RETRY_SECONDS,
+    POOL_SCHEDULER_REFRESH_SECONDS,
+    POOL_SCHEDULER_RETRY_SECONDS,
+    PURGE_BATCH_PAUSE_SECONDS,
+    PURGE_BATCH_SIZE,
+    PURGE_POLL_SECONDS,
+    PURGE_WORKER_ENABLED,
 )
+from .email_worker import EmailOutboxWorker
+from .purge_worker import TombstonePurgeWorker
+from .scheduler import DeadlineScheduler
+
+
+@asynccontextmanager
+async def lifespan(app):
+    scheduler_task = None
+    if POOL_SCHEDULER_ENABLED:
+        scheduler = DeadlineScheduler(
+            concurrency=POOL_SCHEDULER_CONCURRENCY,
+            refresh_seconds=POOL_SCHEDULER_REFRESH_SECONDS,
+            retry_seconds=POOL_SCHEDULER_RETRY_SECONDS,
+            max_retry_seconds=POOL_SCHEDULER_MAX_RETRY_SECONDS,
+            lease_seconds=POOL_SCHEDULER_LEASE_SECONDS,
+        )
+        scheduler_task = asyncio.create_task(scheduler.run())
+
+    email_task = None
+    if EMAIL_OUTBOX_WORKER_ENABLED:
+        email_worker = EmailOutboxWorker(
+            poll_seconds=EMAIL_OUTBOX_POLL_SECONDS,
+            batch_size=EMAIL_OUTBOX_BATCH_SIZE,
+        )
+        email_task = asyncio.create_task(email_worker.run())
+
+    purge_task = None
+    if PURGE_WORKER_ENABLED:
+        purge_worker = TombstonePurgeWorker(
+            poll_seconds=PURGE_POLL_SECONDS,
+            batch_size=PURGE_BATCH_SIZE,
+            pause_seconds=PURGE_BATCH_PAUSE_SECONDS,
+        )
+        purge_task = asyncio.create_task(purge_worker.run())
+
+    yield
+
+    for task in (scheduler_task, email_task, purge_task):
+        if task is None:
+            continue
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    password_pool.shutdown()
 
 
 def create_app():
-    app = FastAPI()
+    app = FastAPI(lifespan=lifespan)
 
     app.add_middleware(
         CORSMiddleware,
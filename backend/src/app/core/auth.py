@@ -1,17 +1,28 @@
+import hmac
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from threading import Lock
+from time import monotonic
 
 from bson import ObjectId
 from bson.errors import InvalidId
 from fastapi import Header, HTTPException, Response, status
 
 from ..db.mongo import users_collection
-from ..schemas.users import UserResponse
+from . import metrics
+from .config import AUTH_USER_CACHE_SECONDS, AUTH_USER_CACHE_SIZE, INTERNAL_API_TOKEN
 from .security import TokenData, create_access_token, decode_access_token
 
 AUTH_HEADER_PREFIX = "Bearer "
 REFRESH_HEADER_NAME = "x-new-token"
 AuthorizationHeader = Header(default="")
+InternalTokenHeader = Header(default="")
+AUTH_STATE_PROJECTION = {
+    "account_status": 1,
+    "email_verified": 1,
+    "token_invalidated_at": 1,
+}
 
 
 @dataclass
@@ -21,26 +32,54 @@ class AuthenticatedUser:
     token_data: TokenData
     document: dict
 
-    @property
-    def response(self):
-        doc = self.document
-        default_pool = doc.get("default_pool")
-        default_pool_id = str(default_pool) if default_pool else None
-        created_at = doc.get("created_at")
-        if isinstance(created_at, datetime):
-            created_value = created_at
-        else:
-            created_value = datetime.now()
-        return UserResponse(
-            id=str(doc["_id"]),
-            username=doc.get("username", ""),
-            email=doc.get("email", ""),
-            account_status=doc.get("account_status", ""),
-            email_verified=doc.get("email_verified", False),
-            created_at=created_value,
-            default_pool=default_pool_id,
+
+_auth_states = OrderedDict()
+_auth_states_lock = Lock()
+_auth_states_generation = 0
+
+
+def _load_auth_state(user_oid):
+    if AUTH_USER_CACHE_SECONDS <= 0:
+        return users_collection.find_one(
+            {"_id": user_oid, "deleted_at": None}, AUTH_STATE_PROJECTION
         )
 
+    now = monotonic()
+    with _auth_states_lock:
+        cached = _auth_states.get(user_oid)
+        if cached is not None and now - cached[1] < AUTH_USER_CACHE_SECONDS:
+            _auth_states.move_to_end(user_oid)
+            metrics.increment("auth.user_cache.hit")
+            return cached[0]
+        generation = _auth_states_generation
+
+    metrics.increment("auth.user_cache.miss")
+    user_doc = users_collection.find_one(
+        {"_id": user_oid, "deleted_at": None}, AUTH_STATE_PROJECTION
+    )
+    if user_doc is None:
+        return None
+
+    with _auth_states_lock:
+        # A write that invalidated this user while we were reading may have
+        # landed after our read, so only cache when nothing was invalidated.
+        if generation == _auth_states_generation:
+            _auth_states[user_oid] = (user_doc, now)
+            _auth_states.move_to_end(user_oid)
+            while len(_auth_states) > max(AUTH_USER_CACHE_SIZE, 1):
+                _auth_states.popitem(last=False)
+    return user_doc
+
+
+def invalidate_authenticated_user(user_oid=None):
+    global _auth_states_generation
+    with _auth_states_lock:
+        _auth_states_generation += 1
+        if user_oid is None:
+            _auth_states.clear()
+        else:
+            _auth_states.pop(user_oid, None)
+
 
 def get_current_active_user(response: Response, authorization=AuthorizationHeader):
     if not authorization or not authorization.startswith(AUTH_HEADER_PREFIX):
@@ -58,7 +97,7 @@ def get_current_active_user(response: Response, authorization=AuthorizationHeade
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials"
         ) from exc
 
-    user_doc = users_collection.find_one({"_id": user_oid})
+    user_doc = _load_auth_state(user_oid)
     if not user_doc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials"
@@ -96,3 +135,13 @@ def get_current_active_user(response: Response, authorization=AuthorizationHeade
         token_data=token_data,
         document=user_doc,
     )
+
+
+def require_internal_token(x_internal_token=InternalTokenHeader):
+    if not INTERNAL_API_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+
+    if not hmac.compare_digest(x_internal_token, INTERNAL_API_TOKEN):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Invalid internal token"
+        )
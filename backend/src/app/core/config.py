@@ -30,6 +30,61 @@ def _int_from_env(name, default):
         raise RuntimeError(f"Invalid integer value for {name}") from exc
 
 
+def _bool_from_env(name, default):
+    raw = environ.get(name)
+    if raw is None:
+        return default
+    return raw.strip().lower() in {"1", "true", "yes", "on"}
+
+
 TOKEN_TTL_DAYS = _int_from_env("JWT_TOKEN_TTL_DAYS", 30)
 TOKEN_REFRESH_INTERVAL_DAYS = _int_from_env("JWT_REFRESH_INTERVAL_DAYS", 3)
 RESEND_API_KEY = _require("RESEND_API_KEY")
+
+SEASON_SNAPSHOT_CACHE_SIZE = _int_from_env("SEASON_SNAPSHOT_CACHE_SIZE", 16)
+SEASON_SNAPSHOT_REVALIDATE_SECONDS = _int_from_env(
+    "SEASON_SNAPSHOT_REVALIDATE_SECONDS", 30
+)
+
+POOL_SCORE_ENGINE = environ.get("POOL_SCORE_ENGINE", "python")
+SEASON_ADVANCE_WORKERS = _int_from_env("SEASON_ADVANCE_WORKERS", 4)
+INTERNAL_API_TOKEN = environ.get("INTERNAL_API_TOKEN")
+
+POOL_SCHEDULER_ENABLED = _bool_from_env("POOL_SCHEDULER_ENABLED", True)
+POOL_SCHEDULER_CONCURRENCY = _int_from_env("POOL_SCHEDULER_CONCURRENCY", 4)
+POOL_SCHEDULER_REFRESH_SECONDS = _int_from_env("POOL_SCHEDULER_REFRESH_SECONDS", 300)
+POOL_SCHEDULER_RETRY_SECONDS = _int_from_env("POOL_SCHEDULER_RETRY_SECONDS", 900)
+POOL_SCHEDULER_MAX_RETRY_SECONDS = _int_from_env(
+    "POOL_SCHEDULER_MAX_RETRY_SECONDS", 14400
+)
+POOL_SCHEDULER_LEASE_SECONDS = _int_from_env("POOL_SCHEDULER_LEASE_SECONDS", 600)
+EPISODE_START_OFFSET_HOURS = _int_from_env("EPISODE_START_OFFSET_HOURS", 24)
+
+PICK_STATS_WATERMARK_LAG_SECONDS = _int_from_env("PICK_STATS_WATERMARK_LAG_SECONDS", 60)
+SEASON_LEADERBOARD_SIZE = _int_from_env("SEASON_LEADERBOARD_SIZE", 100)
+SEASON_LEADERBOARD_MERGE_ATTEMPTS = _int_from_env(
+    "SEASON_LEADERBOARD_MERGE_ATTEMPTS", 3
+)
+
+PASSWORD_HASH_WORKERS = _int_from_env("PASSWORD_HASH_WORKERS", 2)
+PASSWORD_HASH_QUEUE_DEPTH = _int_from_env("PASSWORD_HASH_QUEUE_DEPTH", 8)
+
+AUTH_USER_CACHE_SIZE = _int_from_env("AUTH_USER_CACHE_SIZE", 1024)
+AUTH_USER_CACHE_SECONDS = _int_from_env("AUTH_USER_CACHE_SECONDS", 30)
+AUTH_TOKEN_CACHE_SIZE = _int_from_env("AUTH_TOKEN_CACHE_SIZE", 4096)
+
+EMAIL_TRANSPORT = environ.get("EMAIL_TRANSPORT", "resend")
+EMAIL_OUTBOX_FILE = environ.get("EMAIL_OUTBOX_FILE", "email_outbox.jsonl")
+EMAIL_OUTBOX_WORKER_ENABLED = _bool_from_env("EMAIL_OUTBOX_WORKER_ENABLED", True)
+EMAIL_OUTBOX_POLL_SECONDS = _int_from_env("EMAIL_OUTBOX_POLL_SECONDS", 2)
+EMAIL_OUTBOX_BATCH_SIZE = _int_from_env("EMAIL_OUTBOX_BATCH_SIZE", 50)
+EMAIL_OUTBOX_MAX_ATTEMPTS = _int_from_env("EMAIL_OUTBOX_MAX_ATTEMPTS", 8)
+EMAIL_OUTBOX_RETRY_BASE_SECONDS = _int_from_env("EMAIL_OUTBOX_RETRY_BASE_SECONDS", 30)
+EMAIL_OUTBOX_RETRY_MAX_SECONDS = _int_from_env("EMAIL_OUTBOX_RETRY_MAX_SECONDS", 3600)
+EMAIL_OUTBOX_LEASE_SECONDS = _int_from_env("EMAIL_OUTBOX_LEASE_SECONDS", 300)
+EMAIL_OUTBOX_RETENTION_SECONDS = _int_from_env("EMAIL_OUTBOX_RETENTION_SECONDS", 604800)
+
+PURGE_WORKER_ENABLED = _bool_from_env("PURGE_WORKER_ENABLED", True)
+PURGE_POLL_SECONDS = _int_from_env("PURGE_POLL_SECONDS", 60)
+PURGE_BATCH_SIZE = _int_from_env("PURGE_BATCH_SIZE", 500)
+PURGE_BATCH_PAUSE_SECONDS = _int_from_env("PURGE_BATCH_PAUSE_SECONDS", 2)
@@ -1,11 +1,65 @@
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+from threading import Lock
+
 import resend
 
-from .config import RESEND_API_KEY
+from .config import EMAIL_OUTBOX_FILE, EMAIL_TRANSPORT, RESEND_API_KEY
 
 resend.api_key = RESEND_API_KEY
 
 
-def send_verification_email(recipient, verification_url):
+class ResendTransport:
+    def send(self, message):
+        resend.Emails.send(message)
+
+
+class FileTransport:
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = Lock()
+
+    def send(self, message):
+        record = {"sent_at": datetime.now(UTC).isoformat(), **message}
+        with self._lock, self.path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record) + "\n")
+
+
+class MemoryTransport:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, message):
+        self.sent.append(message)
+
+
+_transport = None
+_transport_lock = Lock()
+
+
+def get_transport():
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            if EMAIL_TRANSPORT == "file":
+                _transport = FileTransport(EMAIL_OUTBOX_FILE)
+            elif EMAIL_TRANSPORT == "memory":
+                _transport = MemoryTransport()
+            elif EMAIL_TRANSPORT == "resend":
+                _transport = ResendTransport()
+            else:
+                raise ValueError(f"Unknown email transport: {EMAIL_TRANSPORT}")
+        return _transport
+
+
+def set_transport(transport):
+    global _transport
+    with _transport_lock:
+        _transport = transport
+
+
+def build_verification_email(recipient, verification_url):
     subject = "Verify your Survivor Pool account"
     html = f"""
     <div style="background:#f3f4f6;padding:32px;">
@@ -72,18 +126,16 @@ def send_verification_email(recipient, verification_url):
         "Thanks for joining Survivor Pool. Confirm your email to secure your "
         f"account: {verification_url}"
     )
-    resend.Emails.send(
-        {
-            "from": "verification@auth.survivorpoolapp.com",
-            "to": recipient,
-            "subject": subject,
-            "html": html,
-            "text": text,
-        }
-    )
+    return {
+        "from": "verification@auth.survivorpoolapp.com",
+        "to": recipient,
+        "subject": subject,
+        "html": html,
+        "text": text,
+    }
 
 
-def send_password_reset_email(recipient, reset_token):
+def build_password_reset_email(recipient, reset_token):
     subject = "Reset your Survivor Pool password"
     html = f"""
     <div style="background:#f3f4f6;padding:32px;">
@@ -141,12 +193,10 @@ def send_password_reset_email(recipient, reset_token):
         "Use this code to reset your Survivor Pool password: "
         f"{reset_token}. If you did not request this, ignore this email."
     )
-    resend.Emails.send(
-        {
-            "from": "recovery@auth.survivorpoolapp.com",
-            "to": recipient,
-            "subject": subject,
-            "html": html,
-            "text": text,
-        }
-    )
+    return {
+        "from": "recovery@auth.survivorpoolapp.com",
+        "to": recipient,
+        "subject": subject,
+        "html": html,
+        "text": text,
+    }
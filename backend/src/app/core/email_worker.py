@@ -0,0 +1,26 @@
+import asyncio
+import logging
+
+from ..services import email_outbox
+
+logger = logging.getLogger(__name__)
+
+
+class EmailOutboxWorker:
+    def __init__(self, *, poll_seconds, batch_size):
+        self._poll_seconds = max(poll_seconds, 1)
+        self._batch_size = max(batch_size, 1)
+
+    async def run(self):
+        while True:
+            try:
+                report = await asyncio.to_thread(
+                    email_outbox.drain_email_outbox, self._batch_size
+                )
+            except Exception:
+                logger.exception("Failed to drain email outbox")
+                report = None
+
+            if report is not None and report.claimed >= self._batch_size:
+                continue
+            await asyncio.sleep(self._poll_seconds)
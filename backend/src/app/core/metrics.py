@@ -0,0 +1,32 @@
+from threading import Lock
+
+_lock = Lock()
+_counters = {}
+_observations = {}
+
+
+def increment(name, amount=1):
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+def observe(name, value):
+    with _lock:
+        summary = _observations.get(name)
+        if summary is None:
+            summary = {"count": 0, "total": 0, "max": value, "last": value}
+            _observations[name] = summary
+        summary["count"] += 1
+        summary["total"] += value
+        summary["max"] = max(summary["max"], value)
+        summary["last"] = value
+
+
+def snapshot():
+    with _lock:
+        return {
+            "counters": dict(_counters),
+            "observations": {
+                name: dict(summary) for name, summary in _observations.items()
+            },
+        }
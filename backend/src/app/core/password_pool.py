@@ -0,0 +1,76 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore, Lock
+from time import perf_counter
+
+import bcrypt
+from fastapi import HTTPException, status
+
+from . import metrics
+from .config import PASSWORD_HASH_QUEUE_DEPTH, PASSWORD_HASH_WORKERS
+
+_executor = None
+_executor_lock = Lock()
+_slots = BoundedSemaphore(
+    max(PASSWORD_HASH_WORKERS, 1) + max(PASSWORD_HASH_QUEUE_DEPTH, 0)
+)
+
+
+def _hashpw(password):
+    return bcrypt.hashpw(password, bcrypt.gensalt())
+
+
+def _checkpw(password, hashed_password):
+    return bcrypt.checkpw(password, hashed_password)
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=PASSWORD_HASH_WORKERS,
+                thread_name_prefix="password-hash",
+            )
+        return _executor
+
+
+async def _run(operation, func, *args):
+    if PASSWORD_HASH_WORKERS <= 0:
+        return await asyncio.to_thread(func, *args)
+
+    if not _slots.acquire(blocking=False):
+        metrics.increment(f"password_pool.rejected.{operation}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Authentication is busy, retry shortly",
+            headers={"Retry-After": "1"},
+        )
+
+    started_at = perf_counter()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(
+            _get_executor(), func, *args
+        )
+    finally:
+        _slots.release()
+        metrics.increment(f"password_pool.{operation}")
+        metrics.observe(
+            f"password_pool.{operation}_ms", (perf_counter() - started_at) * 1000
+        )
+
+
+async def hash_password(password):
+    return await _run("hash", _hashpw, password)
+
+
+async def check_password(password, hashed_password):
+    return await _run("verify", _checkpw, password, hashed_password)
+
+
+def shutdown():
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,28 @@
+import asyncio
+import logging
+
+from ..services import cascade
+
+logger = logging.getLogger(__name__)
+
+
+class TombstonePurgeWorker:
+    def __init__(self, *, poll_seconds, batch_size, pause_seconds):
+        self._poll_seconds = max(poll_seconds, 1)
+        self._batch_size = max(batch_size, 1)
+        self._pause_seconds = max(pause_seconds, 0)
+
+    async def run(self):
+        while True:
+            try:
+                report = await asyncio.to_thread(
+                    cascade.purge_tombstones, self._batch_size
+                )
+            except Exception:
+                logger.exception("Failed to purge tombstones")
+                report = None
+
+            if report is not None and report.documents_deleted >= self._batch_size:
+                await asyncio.sleep(self._pause_seconds)
+                continue
+            await asyncio.sleep(self._poll_seconds)
@@ -0,0 +1,119 @@
+import asyncio
+import heapq
+import logging
+from contextlib import suppress
+from datetime import timedelta
+
+from ..services import deadlines
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class DeadlineScheduler:
+    def __init__(
+        self,
+        *,
+        concurrency,
+        refresh_seconds,
+        retry_seconds,
+        max_retry_seconds,
+        lease_seconds,
+    ):
+        self._semaphore = asyncio.Semaphore(max(concurrency, 1))
+        self._refresh_seconds = max(refresh_seconds, 1)
+        self._retry_seconds = max(retry_seconds, 1)
+        self._max_retry_seconds = max(max_retry_seconds, self._retry_seconds)
+        self._lease_seconds = max(lease_seconds, 1)
+        self._heap = []
+        self._retry_after = {}
+        self._in_flight = set()
+        self._tasks = set()
+        self._wakeup = asyncio.Event()
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        next_refresh = loop.time()
+        while True:
+            if loop.time() >= next_refresh:
+                await self._rebuild()
+                next_refresh = loop.time() + self._refresh_seconds
+
+            self._fire_due()
+
+            delay = next_refresh - loop.time()
+            if self._heap:
+                until_deadline = self._heap[0][0] - deadlines.utc_now()
+                delay = min(delay, until_deadline.total_seconds())
+
+            self._wakeup.clear()
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(delay, 0))
+
+    async def _rebuild(self):
+        try:
+            entries = await asyncio.to_thread(deadlines.load_pool_deadlines)
+        except Exception:
+            logger.exception("Failed to load pool deadlines")
+            return
+
+        heap = []
+        retry_after = {}
+        for deadline, pool_oid, week, season_version in entries:
+            key = (pool_oid, week)
+            retry = self._retry_after.get(key)
+            # A season edit (such as recording the elimination) is what unblocks
+            # an advance, so it resets the backoff and the pool fires right away.
+            if retry is not None and retry[2] == season_version:
+                retry_after[key] = retry
+                deadline = max(deadline, retry[0])
+            heap.append((deadline, pool_oid, week, season_version))
+        heapq.heapify(heap)
+        self._heap = heap
+        # Pools that were deleted, completed or moved to another week no longer
+        # show up in the entries, so their retry state is dropped here.
+        self._retry_after = retry_after
+
+    def _fire_due(self):
+        now = deadlines.utc_now()
+        while self._heap and self._heap[0][0] <= now:
+            _, pool_oid, week, season_version = heapq.heappop(self._heap)
+            key = (pool_oid, week)
+            if key in self._in_flight:
+                continue
+            self._in_flight.add(key)
+            task = asyncio.create_task(self._advance(pool_oid, week, season_version))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _advance(self, pool_oid, week, season_version):
+        key = (pool_oid, week)
+        try:
+            async with self._semaphore:
+                outcome = await asyncio.to_thread(
+                    deadlines.advance_due_pool, pool_oid, week, self._lease_seconds
+                )
+        except Exception:
+            logger.exception("Deadline advance crashed for pool %s", pool_oid)
+            outcome = deadlines.ADVANCE_RETRY
+        finally:
+            self._in_flight.discard(key)
+
+        if outcome == deadlines.ADVANCE_RETRY:
+            metrics.increment("scheduler.advance_retry")
+            self._schedule_retry(key, season_version, self._retry_seconds, 0)
+        elif outcome == deadlines.ADVANCE_BLOCKED:
+            # Validation failures such as a missing elimination only clear once
+            # an admin updates the season, so back off instead of polling.
+            metrics.increment("scheduler.advance_blocked")
+            _, attempts, _ = self._retry_after.get(key, (None, 0, None))
+            delay = min(self._retry_seconds * 2**attempts, self._max_retry_seconds)
+            self._schedule_retry(key, season_version, delay, attempts + 1)
+        else:
+            self._retry_after.pop(key, None)
+
+    def _schedule_retry(self, key, season_version, delay_seconds, attempts):
+        retry_at = deadlines.utc_now() + timedelta(seconds=delay_seconds)
+        self._retry_after[key] = (retry_at, attempts, season_version)
+        heapq.heappush(self._heap, (retry_at, *key, season_version))
+        self._wakeup.set()
@@ -1,11 +1,16 @@
+import hashlib
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from threading import Lock
 
 import bcrypt
 import jwt
 from fastapi import HTTPException, status
 
+from . import metrics, password_pool
 from .config import (
+    AUTH_TOKEN_CACHE_SIZE,
     JWT_ALGORITHM,
     JWT_SECRET_KEY,
     TOKEN_REFRESH_INTERVAL_DAYS,
@@ -17,15 +22,18 @@ DUMMY_PASSWORD_HASH = bcrypt.hashpw(b"placeholder-secret", bcrypt.gensalt()).dec
 )
 
 
-def hash_password(password):
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+async def hash_password(password):
+    hashed_password = await password_pool.hash_password(password.encode("utf-8"))
+    return hashed_password.decode("utf-8")
 
 
-def verify_password(password, hashed_password):
-    return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+async def verify_password(password, hashed_password):
+    return await password_pool.check_password(
+        password.encode("utf-8"), hashed_password.encode("utf-8")
+    )
 
 
-@dataclass
+@dataclass(frozen=True)
 class TokenData:
     user_id: str
     issued_at: datetime
@@ -50,7 +58,51 @@ def create_access_token(user_id, *, issued_at=None):
     return jwt.encode(payload, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
 
 
+_verified_tokens = OrderedDict()
+_verified_tokens_lock = Lock()
+
+
+def _token_digest(token):
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+def _get_verified_token(digest):
+    with _verified_tokens_lock:
+        token_data = _verified_tokens.get(digest)
+        if token_data is None:
+            return None
+        if token_data.expires_at <= datetime.now(UTC):
+            del _verified_tokens[digest]
+            return None
+        _verified_tokens.move_to_end(digest)
+        return token_data
+
+
+def _store_verified_token(digest, token_data):
+    with _verified_tokens_lock:
+        _verified_tokens[digest] = token_data
+        _verified_tokens.move_to_end(digest)
+        while len(_verified_tokens) > AUTH_TOKEN_CACHE_SIZE:
+            _verified_tokens.popitem(last=False)
+
+
 def decode_access_token(token):
+    if AUTH_TOKEN_CACHE_SIZE <= 0:
+        return _decode_access_token(token)
+
+    digest = _token_digest(token)
+    token_data = _get_verified_token(digest)
+    if token_data is not None:
+        metrics.increment("auth.token_cache.hit")
+        return token_data
+
+    metrics.increment("auth.token_cache.miss")
+    token_data = _decode_access_token(token)
+    _store_verified_token(digest, token_data)
+    return token_data
+
+
+def _decode_access_token(token):
     try:
         payload = jwt.decode(
             token,
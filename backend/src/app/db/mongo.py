@@ -1,7 +1,14 @@
+import logging
+
 from pymongo import MongoClient
+from pymongo.errors import OperationFailure
 
 from ..core.config import DATABASE_NAME, MONGO_URL
 
+ILLEGAL_OPERATION_CODE = 20
+
+logger = logging.getLogger(__name__)
+
 client = MongoClient(MONGO_URL)
 db = client[DATABASE_NAME]
 
@@ -10,7 +17,32 @@ pools_collection = db.pools
 pool_memberships_collection = db.pool_memberships
 seasons_collection = db.seasons
 picks_collection = db.picks
+pool_week_pick_stats_collection = db.pool_week_pick_stats
+season_pick_stats_collection = db.season_pick_stats
+analytics_watermarks_collection = db.analytics_watermarks
+scheduler_leases_collection = db.scheduler_leases
+season_leaderboards_collection = db.season_leaderboards
+user_search_grams_collection = db.user_search_grams
+email_outbox_collection = db.email_outbox
 
 
 def ping_database():
     client.admin.command("ping")
+
+
+_transactions_supported = True
+
+
+def run_in_transaction(callback):
+    global _transactions_supported
+    if _transactions_supported:
+        try:
+            with client.start_session() as session:
+                return session.with_transaction(callback)
+        except OperationFailure as exc:
+            # Standalone servers reject transactions before anything is written.
+            if exc.code != ILLEGAL_OPERATION_CODE:
+                raise
+            _transactions_supported = False
+            logger.info("MongoDB deployment does not support transactions")
+    return callback(None)
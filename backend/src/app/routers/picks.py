@@ -3,7 +3,12 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from ..core.auth import AuthenticatedUser, get_current_active_user
-from ..schemas.picks import PickRequest, PickResponse
+from ..schemas.picks import (
+    PickBatchRequest,
+    PickBatchResponse,
+    PickRequest,
+    PickResponse,
+)
 from ..services import picks as picks_service
 
 router = APIRouter(tags=["picks"])
@@ -26,3 +31,16 @@ def create_pick(
             detail="Cannot lock picks for another user",
         )
     return picks_service.create_pick(pool_id, payload)
+
+
+@router.post("/picks/batch", response_model=PickBatchResponse)
+def create_picks_batch(
+    payload: PickBatchRequest,
+    current_user: CurrentUser,
+):
+    if payload.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Cannot lock picks for another user",
+        )
+    return picks_service.create_picks_batch(payload)
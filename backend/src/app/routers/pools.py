@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from ..core.auth import AuthenticatedUser, get_current_active_user
 from ..schemas.pools import (
@@ -8,6 +8,7 @@ from ..schemas.pools import (
     ContestantDetailResponse,
     PoolAdvanceRequest,
     PoolAdvanceResponse,
+    PoolAdvanceSimulationRequest,
     PoolAdvanceStatusResponse,
     PoolAnnouncementResponse,
     PoolAnnouncementSeenRequest,
@@ -22,11 +23,16 @@ from ..schemas.pools import (
     PoolMembershipListResponse,
     PoolResponse,
     PoolStartRequest,
+    PoolWeekPickStatsResponse,
 )
+from ..services import pick_stats as pick_stats_service
 from ..services import pools as pools_service
+from ..services.leaderboards import MAX_LEADERBOARD_PAGE_SIZE
 
 router = APIRouter(tags=["pools"])
 CurrentUser = Annotated[AuthenticatedUser, Depends(get_current_active_user)]
+LeaderboardLimitQuery = Query(None, ge=1, le=MAX_LEADERBOARD_PAGE_SIZE)
+LeaderboardCursorQuery = Query(None)
 
 
 @router.post("/pools", response_model=PoolResponse, status_code=status.HTTP_201_CREATED)
@@ -86,9 +92,25 @@ def get_pool_leaderboard(
     pool_id,
     user_id,
     current_user: CurrentUser,
+    limit: int | None = LeaderboardLimitQuery,
+    cursor: str | None = LeaderboardCursorQuery,
 ):
     _ensure_same_user(user_id, current_user)
-    return pools_service.get_pool_leaderboard(pool_id, user_id)
+    return pools_service.get_pool_leaderboard(pool_id, user_id, limit, cursor)
+
+
+@router.get(
+    "/pools/{pool_id}/weeks/{week}/pick-stats",
+    response_model=PoolWeekPickStatsResponse,
+)
+def get_pool_week_pick_stats(
+    pool_id,
+    week: int,
+    user_id,
+    current_user: CurrentUser,
+):
+    _ensure_same_user(user_id, current_user)
+    return pick_stats_service.get_pool_week_pick_stats(pool_id, week, user_id)
 
 
 @router.get(
@@ -143,6 +165,19 @@ def advance_pool_week(
     return pools_service.advance_pool_week(pool_id, payload)
 
 
+@router.post(
+    "/pools/{pool_id}/advance-week/simulate",
+    response_model=PoolAdvanceResponse,
+)
+def simulate_pool_advance(
+    pool_id,
+    payload: PoolAdvanceSimulationRequest,
+    current_user: CurrentUser,
+):
+    _ensure_same_user(payload.user_id, current_user)
+    return pools_service.simulate_pool_advance(pool_id, payload)
+
+
 @router.get(
     "/pools/{pool_id}/memberships",
     response_model=PoolMembershipListResponse,
@@ -1,5 +1,7 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
+from ..core import metrics
+from ..core.auth import require_internal_token
 from ..db.mongo import ping_database
 
 router = APIRouter(tags=["system"])
@@ -21,3 +23,8 @@ def health_check():
             "database": "disconnected",
             "error": str(exc),
         }
+
+
+@router.get("/metrics", dependencies=[Depends(require_internal_token)])
+def read_metrics():
+    return metrics.snapshot()
@@ -1,11 +1,53 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Query
 
-from ..schemas.seasons import SeasonResponse
+from ..core.auth import get_current_active_user, require_internal_token
+from ..schemas.seasons import (
+    SeasonAdvanceResponse,
+    SeasonLeaderboardResponse,
+    SeasonPickStatsResponse,
+    SeasonResponse,
+)
+from ..services import season_leaderboard as season_leaderboard_service
+from ..services import season_stats as season_stats_service
 from ..services import seasons as seasons_service
+from ..services.leaderboards import MAX_LEADERBOARD_PAGE_SIZE
 
 router = APIRouter(tags=["seasons"])
+LeaderboardLimitQuery = Query(25, ge=1, le=MAX_LEADERBOARD_PAGE_SIZE)
+LeaderboardCursorQuery = Query(None)
 
 
 @router.get("/seasons", response_model=list[SeasonResponse])
 def list_seasons():
     return seasons_service.list_seasons()
+
+
+@router.post(
+    "/seasons/{season_id}/advance-week",
+    response_model=SeasonAdvanceResponse,
+    dependencies=[Depends(require_internal_token)],
+)
+def advance_season_pools(season_id, week: int | None = None):
+    return seasons_service.advance_season_pools(season_id, week)
+
+
+@router.get(
+    "/seasons/{season_id}/pick-stats",
+    response_model=SeasonPickStatsResponse,
+    dependencies=[Depends(get_current_active_user)],
+)
+def get_season_pick_stats(season_id):
+    return season_stats_service.get_season_pick_stats(season_id)
+
+
+@router.get(
+    "/seasons/{season_id}/leaderboard",
+    response_model=SeasonLeaderboardResponse,
+    dependencies=[Depends(get_current_active_user)],
+)
+def get_season_leaderboard(
+    season_id,
+    limit: int = LeaderboardLimitQuery,
+    cursor: str | None = LeaderboardCursorQuery,
+):
+    return season_leaderboard_service.get_season_leaderboard(season_id, limit, cursor)
@@ -25,8 +25,8 @@ LimitQuery = Query(10, ge=1, le=25)
 
 
 @router.post("/users", response_model=UserResponse)
-def create_user(user_data: UserCreateRequest, request: Request):
-    return users_service.create_user(user_data, request)
+async def create_user(user_data: UserCreateRequest, request: Request):
+    return await users_service.create_user(user_data, request)
 
 
 @router.post("/users/resend_verification", status_code=status.HTTP_204_NO_CONTENT)
@@ -35,8 +35,8 @@ def resend_verification(payload: VerificationResendRequest, request: Request):
 
 
 @router.post("/users/login", response_model=UserResponse)
-def login_user(user_data: UserLoginRequest):
-    return users_service.login_user(user_data)
+async def login_user(user_data: UserLoginRequest):
+    return await users_service.login_user(user_data)
 
 
 @router.post("/users/forgot_password", status_code=status.HTTP_204_NO_CONTENT)
@@ -45,18 +45,18 @@ def forgot_password(payload: PasswordResetRequest):
 
 
 @router.post("/users/reset_password", status_code=status.HTTP_204_NO_CONTENT)
-def reset_password(payload: PasswordResetConfirm):
-    users_service.complete_password_reset(payload)
+async def reset_password(payload: PasswordResetConfirm):
+    await users_service.complete_password_reset(payload)
 
 
 @router.patch("/users/{user_id}/password", status_code=status.HTTP_204_NO_CONTENT)
-def update_password(
+async def update_password(
     user_id,
     payload: PasswordUpdateRequest,
     current_user=CurrentUser,
 ):
     _ensure_same_user(user_id, current_user)
-    users_service.update_password(user_id, payload)
+    await users_service.update_password(user_id, payload)
 
 
 @router.patch("/users/{user_id}/default_pool", response_model=UserResponse)
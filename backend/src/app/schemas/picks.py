@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class PickRequest(BaseModel):
@@ -17,3 +17,28 @@ class PickResponse(BaseModel):
     contestant_id: str
     week: int
     locked_at: datetime
+
+
+class PickBatchItem(BaseModel):
+    pool_id: str
+    contestant_id: str
+
+
+class PickBatchRequest(BaseModel):
+    user_id: str
+    picks: list[PickBatchItem] = Field(default_factory=list)
+
+
+class PickBatchResult(BaseModel):
+    pool_id: str
+    contestant_id: str
+    success: bool = False
+    status_code: int | None = None
+    error: str | None = None
+    pick: PickResponse | None = None
+
+
+class PickBatchResponse(BaseModel):
+    user_id: str
+    locked_count: int = 0
+    results: list[PickBatchResult] = Field(default_factory=list)
@@ -12,6 +12,7 @@ class PoolCreateRequest(BaseModel):
     owner_id: str
     start_week: int = 1
     invite_user_ids: list[str] = Field(default_factory=list)
+    pick_deadline_hours: int | None = None
 
 
 class PoolResponse(BaseModel):
@@ -118,6 +119,11 @@ class PoolAdvanceRequest(BaseModel):
     user_id: str
 
 
+class PoolAdvanceSimulationRequest(BaseModel):
+    user_id: str
+    eliminated_contestant_ids: list[str] | None = None
+
+
 class PoolEliminatedMember(BaseModel):
     user_id: str
     username: str
@@ -136,6 +142,21 @@ class PoolAdvanceResponse(BaseModel):
     winners: list[PoolWinnerSummary] = Field(default_factory=list)
 
 
+class PoolWeekPickStat(BaseModel):
+    contestant_id: str
+    contestant_name: str
+    pick_count: int
+    pick_percent: float
+
+
+class PoolWeekPickStatsResponse(BaseModel):
+    pool_id: str
+    week: int
+    total_picks: int = 0
+    locked_at: datetime | None = None
+    contestants: list[PoolWeekPickStat] = Field(default_factory=list)
+
+
 class PoolLeaderboardEntry(BaseModel):
     rank: int
     user_id: str
@@ -159,6 +180,7 @@ class PoolLeaderboardResponse(BaseModel):
     entries: list[PoolLeaderboardEntry]
     winners: list[PoolWinnerSummary] = Field(default_factory=list)
     did_tie: bool = False
+    next_cursor: str | None = None
 
 
 class PoolMemberSummary(BaseModel):
@@ -181,6 +203,33 @@ class PoolMembershipListResponse(BaseModel):
     members: list[PoolMemberSummary]
 
 
+class PoolMembershipUsernameSync(BaseModel):
+    users_scanned: int
+    memberships_updated: int
+
+
+class ScoreEngineMismatch(BaseModel):
+    pool_id: str
+    membership_id: str
+    python_mask: int | None
+    aggregate_mask: int | None
+    python_score: int | None
+    aggregate_score: int | None
+
+
+class ScoreEngineParity(BaseModel):
+    season_id: str
+    pools_checked: int
+    members_checked: int
+    mismatches: list[ScoreEngineMismatch]
+
+
+class TombstonePurge(BaseModel):
+    pools_purged: int = 0
+    users_purged: int = 0
+    documents_deleted: int = 0
+
+
 class PoolInviteRequest(BaseModel):
     owner_id: str
     invited_user_id: str
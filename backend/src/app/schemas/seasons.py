@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from pydantic import BaseModel
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from .pools import PoolAdvanceResponse
 
 
 class SeasonResponse(BaseModel):
@@ -8,3 +12,63 @@ class SeasonResponse(BaseModel):
     season_name: str
     season_number: int | None = None
     final_week: int | None = None
+
+
+class SeasonPoolAdvanceResult(BaseModel):
+    pool_id: str
+    pool_name: str
+    previous_week: int
+    status: str
+    detail: str | None = None
+    result: PoolAdvanceResponse | None = None
+
+
+class SeasonAdvanceResponse(BaseModel):
+    season_id: str
+    week: int | None = None
+    advanced_count: int = 0
+    skipped_count: int = 0
+    failed_count: int = 0
+    pools: list[SeasonPoolAdvanceResult] = Field(default_factory=list)
+
+
+class SeasonContestantPickStat(BaseModel):
+    contestant_id: str
+    contestant_name: str
+    pick_count: int
+    eliminated_count: int
+    survival_rate: float
+
+
+class SeasonWeekPickStats(BaseModel):
+    week: int
+    total_picks: int
+    contestants: list[SeasonContestantPickStat] = Field(default_factory=list)
+
+
+class SeasonPickStatsResponse(BaseModel):
+    season_id: str
+    updated_at: datetime | None = None
+    weeks: list[SeasonWeekPickStats] = Field(default_factory=list)
+
+
+class SeasonLeaderboardEntry(BaseModel):
+    rank: int
+    user_id: str
+    username: str
+    pool_id: str
+    pool_name: str
+    score: int
+
+
+class SeasonLeaderboardResponse(BaseModel):
+    season_id: str
+    updated_at: datetime | None = None
+    entries: list[SeasonLeaderboardEntry] = Field(default_factory=list)
+    next_cursor: str | None = None
+
+
+class SeasonPickStatsRefresh(BaseModel):
+    processed_from: str | None = None
+    processed_to: str | None = None
+    skipped: bool = False
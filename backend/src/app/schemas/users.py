@@ -55,3 +55,15 @@ class UserSearchResult(BaseModel):
     id: str
     username: str
     membership_status: str | None = None
+
+
+class UserSearchIndexRebuild(BaseModel):
+    users_indexed: int
+    grams_written: int
+
+
+class EmailOutboxDrain(BaseModel):
+    claimed: int = 0
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
@@ -0,0 +1,180 @@
+import logging
+from datetime import datetime
+
+from ..core.config import PURGE_BATCH_SIZE
+from ..db.mongo import (
+    picks_collection,
+    pool_memberships_collection,
+    pools_collection,
+    run_in_transaction,
+    users_collection,
+)
+from ..schemas.pools import TombstonePurge
+from . import pick_stats, season_leaderboard, user_search
+
+TOMBSTONED = {"deleted_at": {"$type": "date"}}
+MEMBERSHIP_STATUS_DELETED = "deleted"
+
+logger = logging.getLogger(__name__)
+
+
+def _refresh_season_leaderboards(season_ids):
+    for season_oid in season_ids:
+        if season_oid:
+            season_leaderboard.refresh_season_leaderboard(season_oid)
+
+
+def tombstone_pool(pool):
+    now = datetime.now()
+
+    def _apply(session):
+        update_result = pools_collection.update_one(
+            {"_id": pool["_id"], "deleted_at": None},
+            {"$set": {"deleted_at": now}},
+            session=session,
+        )
+        if update_result.modified_count:
+            users_collection.update_many(
+                {"default_pool": pool["_id"]},
+                {"$set": {"default_pool": None}},
+                session=session,
+            )
+        return update_result.modified_count
+
+    tombstoned_count = run_in_transaction(_apply)
+    if pool.get("seasonId"):
+        season_leaderboard.refresh_pool_entries(pool["seasonId"], pool["_id"])
+    return tombstoned_count
+
+
+def tombstone_user(user_oid):
+    now = datetime.now()
+    owned_pools = list(
+        pools_collection.find(
+            {"ownerId": user_oid, "deleted_at": None}, {"_id": 1, "seasonId": 1}
+        )
+    )
+    owned_pool_ids = [pool["_id"] for pool in owned_pools]
+    member_pool_ids = pool_memberships_collection.distinct(
+        "poolId", {"userId": user_oid}
+    )
+    season_ids = {pool.get("seasonId") for pool in owned_pools}
+    if member_pool_ids:
+        season_ids.update(
+            pools_collection.distinct("seasonId", {"_id": {"$in": member_pool_ids}})
+        )
+
+    # Free the unique username and email right away; the purge may run much later.
+    placeholder = f"deleted:{user_oid}"
+
+    def _apply(session):
+        update_result = users_collection.update_one(
+            {"_id": user_oid, "deleted_at": None},
+            {
+                "$set": {
+                    "deleted_at": now,
+                    "account_status": "deleted",
+                    "username": placeholder,
+                    "username_lower": placeholder,
+                    "email": placeholder,
+                }
+            },
+            session=session,
+        )
+        if not update_result.modified_count:
+            return 0
+
+        if owned_pool_ids:
+            pools_collection.update_many(
+                {"_id": {"$in": owned_pool_ids}, "deleted_at": None},
+                {"$set": {"deleted_at": now}},
+                session=session,
+            )
+            users_collection.update_many(
+                {"default_pool": {"$in": owned_pool_ids}},
+                {"$set": {"default_pool": None}},
+                session=session,
+            )
+        # Every membership read filters on status, so the deleted status hides
+        # the user from rosters and scores until the purge removes the rows.
+        pool_memberships_collection.update_many(
+            {"userId": user_oid},
+            {
+                "$set": {
+                    "status": MEMBERSHIP_STATUS_DELETED,
+                    "deleted_at": now,
+                    "score": 0,
+                    "available_mask": 0,
+                }
+            },
+            session=session,
+        )
+        user_search.remove_user(user_oid, session=session)
+        return update_result.modified_count
+
+    tombstoned_count = run_in_transaction(_apply)
+    _refresh_season_leaderboards(season_ids)
+    return tombstoned_count
+
+
+def _purge_batch(collection, selector, limit):
+    if limit <= 0:
+        return 0
+
+    doc_ids = [doc["_id"] for doc in collection.find(selector, {"_id": 1}).limit(limit)]
+    if doc_ids:
+        collection.delete_many({"_id": {"$in": doc_ids}})
+    return len(doc_ids)
+
+
+def _purge_dependents(report, budget, dependents):
+    for collection, selector in dependents:
+        report.documents_deleted += _purge_batch(
+            collection, selector, budget - report.documents_deleted
+        )
+        if report.documents_deleted >= budget:
+            return False
+    return True
+
+
+def purge_tombstones(batch_size=None):
+    budget = max(batch_size or PURGE_BATCH_SIZE, 1)
+    report = TombstonePurge()
+
+    for pool in list(
+        pools_collection.find(TOMBSTONED, {"_id": 1}).sort("deleted_at", 1)
+    ):
+        pool_selector = {"poolId": pool["_id"]}
+        dependents = (
+            (picks_collection, pool_selector),
+            (pool_memberships_collection, pool_selector),
+        )
+        if not _purge_dependents(report, budget, dependents):
+            return report
+        pick_stats.delete_pool_stats(pool["_id"])
+        pools_collection.delete_one({"_id": pool["_id"], **TOMBSTONED})
+        report.pools_purged += 1
+
+    for user in list(
+        users_collection.find(TOMBSTONED, {"_id": 1}).sort("deleted_at", 1)
+    ):
+        user_selector = {"userId": user["_id"]}
+        dependents = (
+            (picks_collection, user_selector),
+            (pool_memberships_collection, user_selector),
+        )
+        if not _purge_dependents(report, budget, dependents):
+            return report
+        if pools_collection.count_documents({"ownerId": user["_id"]}, limit=1):
+            continue
+        users_collection.delete_one({"_id": user["_id"], **TOMBSTONED})
+        report.users_purged += 1
+
+    if report.pools_purged or report.users_purged:
+        logger.info(
+            "purged tombstones pools=%s users=%s documents=%s",
+            report.pools_purged,
+            report.users_purged,
+            report.documents_deleted,
+        )
+    return report
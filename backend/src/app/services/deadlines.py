@@ -0,0 +1,126 @@
+import heapq
+import logging
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from fastapi import HTTPException
+from pymongo.errors import DuplicateKeyError
+
+from ..core.config import EPISODE_START_OFFSET_HOURS
+from ..db.mongo import pools_collection, scheduler_leases_collection
+from . import pools as pools_service
+from .season_snapshots import get_season_snapshot
+
+ADVANCE_BLOCKED = "blocked"
+ADVANCE_DONE = "done"
+ADVANCE_RETRY = "retry"
+ADVANCE_SKIPPED = "skipped"
+
+WORKER_ID = uuid4().hex
+
+logger = logging.getLogger(__name__)
+
+
+def utc_now():
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def pick_deadline_hours(settings):
+    hours = (settings or {}).get("pick_deadline_hours")
+    if isinstance(hours, bool) or not isinstance(hours, int | float) or hours < 0:
+        return None
+    return hours
+
+
+def pick_deadline(season, settings, week):
+    hours = pick_deadline_hours(settings)
+    if hours is None or not isinstance(season.air_date, datetime):
+        return None
+
+    return season.air_date + timedelta(
+        weeks=max(week, 1) - 1,
+        hours=EPISODE_START_OFFSET_HOURS - hours,
+    )
+
+
+def load_pool_deadlines():
+    cursor = pools_collection.find(
+        {
+            "status": pools_service.POOL_STATUS_OPEN,
+            "settings.pick_deadline_hours": {"$exists": True},
+            "deleted_at": None,
+        },
+        {"seasonId": 1, "current_week": 1, "settings": 1, "started_at": 1},
+    )
+
+    entries = []
+    for pool in cursor:
+        season = get_season_snapshot(pool.get("seasonId"))
+        if not season:
+            continue
+        current_week = pool.get("current_week", 1)
+        deadline = pick_deadline(season, pool.get("settings"), current_week)
+        started_at = pool.get("started_at")
+        if deadline is None or (started_at is not None and deadline <= started_at):
+            continue
+        entries.append((deadline, pool["_id"], current_week, season.version))
+
+    heapq.heapify(entries)
+    return entries
+
+
+def advance_due_pool(pool_oid, week, lease_seconds):
+    lease_id = f"advance:{pool_oid}:{week}"
+    if not _acquire_lease(lease_id, lease_seconds):
+        return ADVANCE_SKIPPED
+
+    pool = pools_collection.find_one(
+        {
+            "_id": pool_oid,
+            "current_week": week,
+            "status": pools_service.POOL_STATUS_OPEN,
+            "deleted_at": None,
+        }
+    )
+    if not pool:
+        return ADVANCE_DONE
+
+    try:
+        pools_service.advance_pool(pool)
+    except HTTPException as exc:
+        _release_lease(lease_id)
+        if exc.status_code < 500:
+            logger.warning(
+                "Deadline advance blocked for pool %s: %s", pool_oid, exc.detail
+            )
+            return ADVANCE_BLOCKED
+        logger.error("Deadline advance failed for pool %s: %s", pool_oid, exc.detail)
+        return ADVANCE_RETRY
+    except Exception:
+        logger.exception("Deadline advance failed for pool %s", pool_oid)
+        _release_lease(lease_id)
+        return ADVANCE_RETRY
+
+    return ADVANCE_DONE
+
+
+def _acquire_lease(lease_id, lease_seconds):
+    now = utc_now()
+    lease = {
+        "owner": WORKER_ID,
+        "acquired_at": now,
+        "expires_at": now + timedelta(seconds=lease_seconds),
+    }
+    try:
+        scheduler_leases_collection.insert_one({"_id": lease_id, **lease})
+        return True
+    except DuplicateKeyError:
+        taken = scheduler_leases_collection.find_one_and_update(
+            {"_id": lease_id, "expires_at": {"$lte": now}},
+            {"$set": lease},
+        )
+        return taken is not None
+
+
+def _release_lease(lease_id):
+    scheduler_leases_collection.delete_one({"_id": lease_id, "owner": WORKER_ID})
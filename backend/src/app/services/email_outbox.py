@@ -0,0 +1,216 @@
+import logging
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from pymongo.errors import DuplicateKeyError
+
+from ..core import metrics
+from ..core.config import (
+    EMAIL_OUTBOX_BATCH_SIZE,
+    EMAIL_OUTBOX_LEASE_SECONDS,
+    EMAIL_OUTBOX_MAX_ATTEMPTS,
+    EMAIL_OUTBOX_RETENTION_SECONDS,
+    EMAIL_OUTBOX_RETRY_BASE_SECONDS,
+    EMAIL_OUTBOX_RETRY_MAX_SECONDS,
+)
+from ..core.email import (
+    build_password_reset_email,
+    build_verification_email,
+    get_transport,
+)
+from ..db.mongo import email_outbox_collection
+from ..schemas.users import EmailOutboxDrain
+
+EMAIL_KIND_VERIFICATION = "verification"
+EMAIL_KIND_PASSWORD_RESET = "password_reset"  # noqa: S105
+
+EMAIL_STATUS_PENDING = "pending"
+EMAIL_STATUS_SENDING = "sending"
+EMAIL_STATUS_SENT = "sent"
+EMAIL_STATUS_FAILED = "failed"
+EMAIL_STATUS_SUPERSEDED = "superseded"
+
+logger = logging.getLogger(__name__)
+
+
+def utc_now():
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def enqueue_email(kind, message):
+    now = utc_now()
+    recipient = message["to"]
+    dedupe_key = f"{kind}:{recipient.lower()}"
+    update = {
+        "$set": {
+            "message": message,
+            "attempts": 0,
+            "next_attempt_at": now,
+            "last_error": None,
+            "updated_at": now,
+        },
+        "$setOnInsert": {
+            "kind": kind,
+            "recipient": recipient,
+            "dedupe_key": dedupe_key,
+            "status": EMAIL_STATUS_PENDING,
+            "created_at": now,
+        },
+    }
+
+    try:
+        email_outbox_collection.update_one(
+            {"dedupe_key": dedupe_key, "status": EMAIL_STATUS_PENDING},
+            update,
+            upsert=True,
+        )
+    except DuplicateKeyError:
+        email_outbox_collection.update_one(
+            {"dedupe_key": dedupe_key, "status": EMAIL_STATUS_PENDING},
+            update,
+        )
+    metrics.increment(f"email_outbox.enqueued.{kind}")
+
+
+def queue_verification_email(recipient, verification_url):
+    enqueue_email(
+        EMAIL_KIND_VERIFICATION,
+        build_verification_email(recipient, verification_url),
+    )
+
+
+def queue_password_reset_email(recipient, reset_token):
+    enqueue_email(
+        EMAIL_KIND_PASSWORD_RESET,
+        build_password_reset_email(recipient, reset_token),
+    )
+
+
+def _retry_delay(attempts):
+    delay = EMAIL_OUTBOX_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(delay, EMAIL_OUTBOX_RETRY_MAX_SECONDS))
+
+
+def _finish(status, finished_at, **fields):
+    # Terminal jobs drop the rendered message, which carries the reset token or
+    # verification link, and expire through the expires_at TTL index.
+    expires_at = finished_at + timedelta(seconds=EMAIL_OUTBOX_RETENTION_SECONDS)
+    return {
+        "$set": {"status": status, "expires_at": expires_at, **fields},
+        "$unset": {"claim_id": "", "message": ""},
+    }
+
+
+def _claim_batch(now, batch_size):
+    stale_before = now - timedelta(seconds=EMAIL_OUTBOX_LEASE_SECONDS)
+    due = {
+        "$or": [
+            {"status": EMAIL_STATUS_PENDING, "next_attempt_at": {"$lte": now}},
+            {"status": EMAIL_STATUS_SENDING, "claimed_at": {"$lt": stale_before}},
+        ]
+    }
+    job_ids = [
+        job["_id"]
+        for job in email_outbox_collection.find(due, {"_id": 1})
+        .sort("next_attempt_at", 1)
+        .limit(batch_size)
+    ]
+    if not job_ids:
+        return None, []
+
+    claim_id = uuid4().hex
+    email_outbox_collection.update_many(
+        {"_id": {"$in": job_ids}, **due},
+        {
+            "$set": {
+                "status": EMAIL_STATUS_SENDING,
+                "claim_id": claim_id,
+                "claimed_at": now,
+            }
+        },
+    )
+    jobs = list(
+        email_outbox_collection.find(
+            {"claim_id": claim_id, "status": EMAIL_STATUS_SENDING},
+            {"message": 1, "attempts": 1, "kind": 1},
+        )
+    )
+    return claim_id, jobs
+
+
+def _record_failure(job, claim_id, now, exc):
+    attempts = job.get("attempts", 0) + 1
+    if attempts >= EMAIL_OUTBOX_MAX_ATTEMPTS:
+        outcome = EMAIL_STATUS_FAILED
+        update = _finish(
+            outcome,
+            now,
+            failed_at=now,
+            attempts=attempts,
+            last_error=str(exc),
+        )
+    else:
+        outcome = EMAIL_STATUS_PENDING
+        update = {
+            "$set": {
+                "status": outcome,
+                "next_attempt_at": now + _retry_delay(attempts),
+                "attempts": attempts,
+                "last_error": str(exc),
+            },
+            "$unset": {"claim_id": ""},
+        }
+
+    try:
+        email_outbox_collection.update_one(
+            {"_id": job["_id"], "claim_id": claim_id}, update
+        )
+    except DuplicateKeyError:
+        email_outbox_collection.update_one(
+            {"_id": job["_id"], "claim_id": claim_id},
+            _finish(
+                EMAIL_STATUS_SUPERSEDED,
+                now,
+                superseded_at=now,
+                attempts=attempts,
+                last_error=str(exc),
+            ),
+        )
+        return EMAIL_STATUS_SUPERSEDED
+    return outcome
+
+
+def drain_email_outbox(batch_size=None, transport=None):
+    now = utc_now()
+    claim_id, jobs = _claim_batch(now, max(batch_size or EMAIL_OUTBOX_BATCH_SIZE, 1))
+    report = EmailOutboxDrain(claimed=len(jobs))
+    if not jobs:
+        return report
+
+    transport = transport or get_transport()
+    sent_ids = []
+    for job in jobs:
+        try:
+            transport.send(job["message"])
+        except Exception as exc:
+            logger.warning("Failed to send outbox email %s: %s", job["_id"], exc)
+            outcome = _record_failure(job, claim_id, now, exc)
+            if outcome == EMAIL_STATUS_FAILED:
+                report.failed += 1
+            else:
+                report.retried += 1
+            continue
+        sent_ids.append(job["_id"])
+
+    if sent_ids:
+        sent_at = utc_now()
+        email_outbox_collection.update_many(
+            {"_id": {"$in": sent_ids}, "claim_id": claim_id},
+            _finish(EMAIL_STATUS_SENT, sent_at, sent_at=sent_at),
+        )
+    report.sent = len(sent_ids)
+
+    metrics.increment("email_outbox.sent", report.sent)
+    metrics.increment("email_outbox.retried", report.retried)
+    metrics.increment("email_outbox.failed", report.failed)
+    return report
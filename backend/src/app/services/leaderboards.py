@@ -0,0 +1,105 @@
+import base64
+import binascii
+import json
+
+from fastapi import HTTPException, status
+
+from .common import parse_object_id
+
+LEADERBOARD_SORT = {"score": -1, "username_lower": 1, "userId": 1, "poolId": 1}
+MAX_LEADERBOARD_PAGE_SIZE = 100
+
+
+def encode_cursor(entry, rank, position):
+    payload = {
+        "score": entry["score"],
+        "username_lower": entry.get("username_lower") or "",
+        "user_id": str(entry["userId"]),
+        "pool_id": str(entry["poolId"]),
+        "rank": rank,
+        "position": position,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return {
+            "score": int(payload["score"]),
+            "username_lower": payload["username_lower"] or "",
+            "userId": parse_object_id(payload["user_id"], "cursor"),
+            "poolId": parse_object_id(payload["pool_id"], "cursor"),
+            "rank": int(payload["rank"]),
+            "position": int(payload["position"]),
+        }
+    except (binascii.Error, ValueError, KeyError, TypeError, HTTPException) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid leaderboard cursor",
+        ) from exc
+
+
+def sort_key(entry):
+    return (
+        -entry["score"],
+        entry.get("username_lower") or "",
+        entry["userId"],
+        entry["poolId"],
+    )
+
+
+def keyset_pipeline(selector, after, limit, projection):
+    selector = dict(selector)
+    if after is not None:
+        username_lower = after.get("username_lower") or ""
+        selector["$or"] = [
+            {"score": {"$lt": after["score"]}},
+            {
+                "score": after["score"],
+                "username_lower": {"$gt": username_lower},
+            },
+            {
+                "score": after["score"],
+                "username_lower": username_lower,
+                "userId": {"$gt": after["userId"]},
+            },
+            {
+                "score": after["score"],
+                "username_lower": username_lower,
+                "userId": after["userId"],
+                "poolId": {"$gt": after["poolId"]},
+            },
+        ]
+
+    pipeline = [{"$match": selector}, {"$sort": LEADERBOARD_SORT}]
+    if limit is not None:
+        pipeline.append({"$limit": limit + 1})
+
+    rank = "$page_rank"
+    if after is not None:
+        rank = {
+            "$cond": [
+                {"$eq": ["$score", after["score"]]},
+                after["rank"],
+                {"$add": [after["position"], "$page_rank"]},
+            ]
+        }
+
+    pipeline.extend(
+        [
+            {
+                "$setWindowFields": {
+                    "sortBy": {"score": -1},
+                    "output": {"page_rank": {"$rank": {}}},
+                }
+            },
+            # The window stage only orders by score, so restore the tie order the
+            # next cursor is taken from.
+            {"$sort": LEADERBOARD_SORT},
+            {"$project": {"_id": 0, **projection, "rank": rank}},
+        ]
+    )
+    return pipeline
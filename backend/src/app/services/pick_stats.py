@@ -0,0 +1,94 @@
+from fastapi import HTTPException, status
+
+from ..db.mongo import (
+    picks_collection,
+    pool_memberships_collection,
+    pool_week_pick_stats_collection,
+    pools_collection,
+)
+from ..schemas.pools import PoolWeekPickStat, PoolWeekPickStatsResponse
+from .common import parse_object_id
+from .season_snapshots import get_season_snapshot
+
+
+def freeze_week(pool_oid, week, now):
+    # Counts stay hidden until the week locks, so they are built once, here.
+    counts = {
+        row["_id"]: row["count"]
+        for row in picks_collection.aggregate(
+            [
+                {"$match": {"poolId": pool_oid, "week": week}},
+                {"$group": {"_id": "$contestant_id", "count": {"$sum": 1}}},
+            ]
+        )
+    }
+    pool_week_pick_stats_collection.update_one(
+        {"poolId": pool_oid, "week": week},
+        {
+            "$set": {
+                "counts": counts,
+                "total": sum(counts.values()),
+                "locked": True,
+                "locked_at": now,
+            }
+        },
+        upsert=True,
+    )
+
+
+def delete_pool_stats(pool_oid):
+    pool_week_pick_stats_collection.delete_many({"poolId": pool_oid})
+
+
+def get_pool_week_pick_stats(pool_id, week, user_id):
+    pool_oid = parse_object_id(pool_id, "pool_id")
+    user_oid = parse_object_id(user_id, "user_id")
+
+    pool = pools_collection.find_one(
+        {"_id": pool_oid, "deleted_at": None}, {"seasonId": 1}
+    )
+    if not pool:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Pool not found",
+        )
+
+    membership = pool_memberships_collection.find_one(
+        {"poolId": pool_oid, "userId": user_oid}, {"status": 1}
+    )
+    if not membership or membership.get("status") in {"invited", "declined"}:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User is not a member of this pool",
+        )
+
+    stats = pool_week_pick_stats_collection.find_one({"poolId": pool_oid, "week": week})
+    if not stats or not stats.get("locked"):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Pick stats are not available until the week is locked",
+        )
+
+    season = get_season_snapshot(pool.get("seasonId"))
+    total = stats.get("total", 0)
+    contestants = [
+        PoolWeekPickStat(
+            contestant_id=contestant_id,
+            contestant_name=(
+                season.contestant_name(contestant_id) if season else contestant_id
+            ),
+            pick_count=count,
+            pick_percent=round(count * 100 / total, 1) if total else 0.0,
+        )
+        for contestant_id, count in (stats.get("counts") or {}).items()
+        if count > 0
+    ]
+    contestants.sort(key=lambda stat: (-stat.pick_count, stat.contestant_name.lower()))
+
+    return PoolWeekPickStatsResponse(
+        pool_id=str(pool_oid),
+        week=week,
+        total_picks=total,
+        locked_at=stats.get("locked_at"),
+        contestants=contestants,
+    )
@@ -1,22 +1,157 @@
 from datetime import datetime
 
 from fastapi import HTTPException, status
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
 from ..db.mongo import (
     picks_collection,
     pool_memberships_collection,
     pools_collection,
-    seasons_collection,
 )
-from ..schemas.picks import PickResponse
+from ..schemas.picks import PickBatchResponse, PickBatchResult, PickResponse
 from .common import parse_object_id
+from .deadlines import pick_deadline, utc_now
+from .season_snapshots import get_season_snapshot
+
+MAX_BATCH_PICKS = 20
+DUPLICATE_KEY_ERROR_CODE = 11000
 
 
 def create_pick(pool_id, payload):
     pool_oid = parse_object_id(pool_id, "pool_id")
     user_oid = parse_object_id(payload.user_id, "user_id")
 
-    pool = pools_collection.find_one({"_id": pool_oid})
+    pool = _load_pool_with_membership(pool_oid, user_oid)
+    membership = pool["membership"][0] if pool and pool.get("membership") else None
+    pick_doc = _prepare_pick(
+        pool_oid, user_oid, pool, membership, payload.contestant_id
+    )
+
+    try:
+        insert_result = picks_collection.insert_one(pick_doc)
+    except DuplicateKeyError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Pick already locked for this week",
+        ) from exc
+
+    if not insert_result.inserted_id:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to lock pick",
+        )
+
+    return _build_pick_response(pick_doc)
+
+
+def create_picks_batch(payload):
+    user_oid = parse_object_id(payload.user_id, "user_id")
+    if len(payload.picks) > MAX_BATCH_PICKS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BATCH_PICKS} picks per request",
+        )
+
+    results = [
+        PickBatchResult(pool_id=item.pool_id, contestant_id=item.contestant_id)
+        for item in payload.picks
+    ]
+
+    pool_oids = {}
+    for index, item in enumerate(payload.picks):
+        try:
+            pool_oid = parse_object_id(item.pool_id, "pool_id")
+        except HTTPException as exc:
+            _mark_pick_failed(results[index], exc)
+            continue
+        if pool_oid in pool_oids.values():
+            _mark_pick_failed(
+                results[index],
+                HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Duplicate pool in request",
+                ),
+            )
+            continue
+        pool_oids[index] = pool_oid
+
+    pools_by_id = {
+        pool["_id"]: pool
+        for pool in pools_collection.find(
+            {"_id": {"$in": list(pool_oids.values())}, "deleted_at": None},
+            {"status": 1, "current_week": 1, "seasonId": 1, "settings": 1},
+        )
+    }
+    memberships_by_pool = {
+        membership["poolId"]: membership
+        for membership in pool_memberships_collection.find(
+            {"poolId": {"$in": list(pool_oids.values())}, "userId": user_oid},
+            {"poolId": 1, "status": 1, "available_mask": 1},
+        )
+    }
+
+    pending = []
+    for index, pool_oid in pool_oids.items():
+        try:
+            pick_doc = _prepare_pick(
+                pool_oid,
+                user_oid,
+                pools_by_id.get(pool_oid),
+                memberships_by_pool.get(pool_oid),
+                payload.picks[index].contestant_id,
+            )
+        except HTTPException as exc:
+            _mark_pick_failed(results[index], exc)
+            continue
+        pending.append((index, pick_doc))
+
+    failed_writes = {}
+    if pending:
+        try:
+            picks_collection.insert_many(
+                [pick_doc for _, pick_doc in pending], ordered=False
+            )
+        except BulkWriteError as exc:
+            for write_error in exc.details.get("writeErrors", []):
+                failed_writes[write_error["index"]] = write_error
+
+    for position, (index, pick_doc) in enumerate(pending):
+        write_error = failed_writes.get(position)
+        if write_error is None:
+            results[index].success = True
+            results[index].status_code = status.HTTP_201_CREATED
+            results[index].pick = _build_pick_response(pick_doc)
+        elif write_error.get("code") == DUPLICATE_KEY_ERROR_CODE:
+            _mark_pick_failed(
+                results[index],
+                HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Pick already locked for this week",
+                ),
+            )
+        else:
+            _mark_pick_failed(
+                results[index],
+                HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Failed to lock pick",
+                ),
+            )
+
+    return PickBatchResponse(
+        user_id=str(user_oid),
+        locked_count=sum(result.success for result in results),
+        results=results,
+    )
+
+
+def _mark_pick_failed(result, exc):
+    result.success = False
+    result.status_code = exc.status_code
+    result.error = exc.detail
+
+
+def _prepare_pick(pool_oid, user_oid, pool, membership, contestant_id):
     if not pool:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -35,9 +170,6 @@ def create_pick(pool_id, payload):
             detail="Pool has not started yet",
         )
 
-    membership = pool_memberships_collection.find_one(
-        {"poolId": pool_oid, "userId": user_oid}
-    )
     membership_status = membership.get("status") if membership else None
     if membership_status == "winner":
         raise HTTPException(
@@ -58,10 +190,7 @@ def create_pick(pool_id, payload):
             detail="Pool season not configured",
         )
 
-    season = seasons_collection.find_one(
-        {"_id": season_id},
-        {"contestants": 1, "eliminations": 1},
-    )
+    season = get_season_snapshot(season_id)
     if not season:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -70,8 +199,72 @@ def create_pick(pool_id, payload):
 
     current_week = pool["current_week"]
 
+    deadline = pick_deadline(season, pool.get("settings"), current_week)
+    if deadline is not None and utc_now() >= deadline:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Pick deadline has passed",
+        )
+
+    available_mask = membership.get("available_mask")
+    if not (
+        isinstance(available_mask, int)
+        and available_mask & season.contestant_bit(contestant_id)
+    ):
+        _check_pick_rejection(pool_oid, user_oid, season, contestant_id, current_week)
+
+    return {
+        "poolId": pool_oid,
+        "userId": user_oid,
+        "contestant_id": contestant_id,
+        "week": current_week,
+        "created_at": datetime.now(),
+        "result": "pending",
+    }
+
+
+def _build_pick_response(pick_doc):
+    return PickResponse(
+        pick_id=str(pick_doc["_id"]),
+        pool_id=str(pick_doc["poolId"]),
+        user_id=str(pick_doc["userId"]),
+        contestant_id=pick_doc["contestant_id"],
+        week=pick_doc["week"],
+        locked_at=pick_doc["created_at"],
+    )
+
+
+def _load_pool_with_membership(pool_oid, user_oid):
+    cursor = pools_collection.aggregate(
+        [
+            {"$match": {"_id": pool_oid, "deleted_at": None}},
+            {
+                "$project": {
+                    "status": 1,
+                    "current_week": 1,
+                    "seasonId": 1,
+                    "settings": 1,
+                }
+            },
+            {
+                "$lookup": {
+                    "from": pool_memberships_collection.name,
+                    "pipeline": [
+                        {"$match": {"poolId": pool_oid, "userId": user_oid}},
+                        {"$project": {"status": 1, "available_mask": 1}},
+                    ],
+                    "as": "membership",
+                }
+            },
+        ]
+    )
+    return next(cursor, None)
+
+
+def _check_pick_rejection(pool_oid, user_oid, season, contestant_id, current_week):
     existing_pick = picks_collection.find_one(
-        {"userId": user_oid, "poolId": pool_oid, "week": current_week}
+        {"userId": user_oid, "poolId": pool_oid, "week": current_week},
+        {"_id": 1},
     )
     if existing_pick:
         raise HTTPException(
@@ -79,20 +272,15 @@ def create_pick(pool_id, payload):
             detail="Pick already locked for this week",
         )
 
-    contestant = None
-    for candidate in season.get("contestants", []):
-        if candidate.get("id") == payload.contestant_id:
-            contestant = candidate
-            break
-
-    if not contestant:
+    if not season.contestant(contestant_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Contestant not found",
         )
 
     prior_pick = picks_collection.find_one(
-        {"userId": user_oid, "poolId": pool_oid, "contestant_id": payload.contestant_id}
+        {"userId": user_oid, "poolId": pool_oid, "contestant_id": contestant_id},
+        {"week": 1},
     )
     if prior_pick:
         prior_week = prior_pick.get("week")
@@ -104,41 +292,9 @@ def create_pick(pool_id, payload):
             ),
         )
 
-    eliminated_week = None
-    for elimination in season.get("eliminations", []):
-        if elimination.get("eliminated_contestant_id") == payload.contestant_id:
-            eliminated_week = elimination["week"]
-            break
-
+    eliminated_week = season.elimination_week(contestant_id)
     if eliminated_week is not None and eliminated_week < current_week:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Contestant already eliminated",
         )
-
-    now = datetime.now()
-    pick_doc = {
-        "poolId": pool_oid,
-        "userId": user_oid,
-        "contestant_id": payload.contestant_id,
-        "week": current_week,
-        "created_at": now,
-        "result": "pending",
-    }
-
-    insert_result = picks_collection.insert_one(pick_doc)
-    inserted_id = insert_result.inserted_id
-    if not inserted_id:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to lock pick",
-        )
-
-    return PickResponse(
-        pick_id=str(inserted_id),
-        pool_id=str(pool_oid),
-        user_id=str(user_oid),
-        contestant_id=payload.contestant_id,
-        week=current_week,
-        locked_at=now,
-    )
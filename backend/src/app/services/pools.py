@@ -1,8 +1,14 @@
+import logging
+from dataclasses import dataclass
 from datetime import datetime
+from time import perf_counter
 
+from bson import ObjectId
 from fastapi import HTTPException, status
-from pymongo import ReturnDocument
+from pymongo import ReturnDocument, UpdateMany, UpdateOne
 
+from ..core import metrics
+from ..core.config import POOL_SCORE_ENGINE
 from ..db.mongo import (
     picks_collection,
     pool_memberships_collection,
@@ -13,7 +19,6 @@ from ..db.mongo import (
 from ..schemas.pools import (
     AvailableContestantResponse,
     AvailableContestantsResponse,
-    ContestantAdvantage,
     ContestantDetail,
     ContestantDetailResponse,
     CurrentPickSummary,
@@ -32,11 +37,16 @@ from ..schemas.pools import (
     PoolLeaderboardEntry,
     PoolLeaderboardResponse,
     PoolMembershipListResponse,
+    PoolMembershipUsernameSync,
     PoolMemberSummary,
     PoolResponse,
     PoolWinnerSummary,
+    ScoreEngineMismatch,
+    ScoreEngineParity,
 )
+from . import cascade, deadlines, leaderboards, pick_stats, season_leaderboard
 from .common import parse_object_id
+from .season_snapshots import NO_TRIBE, get_season_snapshot
 
 ELIMINATION_REASON_MISSED_PICK = "missed_pick"
 ELIMINATION_REASON_CONTESTANT = "contestant_voted_out"
@@ -47,87 +57,29 @@ POOL_STATUS_INVITE = "invite"
 POOL_STATUS_COMPLETED = "completed"
 MEMBERSHIP_STATUS_WINNER = "winner"
 
+SCORE_ENGINE_PYTHON = "python"
+SCORE_ENGINE_AGGREGATE = "aggregate"
+SCORE_ENGINES = {SCORE_ENGINE_PYTHON, SCORE_ENGINE_AGGREGATE}
+SCORE_BULK_WRITE_CHUNK_SIZE = 500
+LARGE_POOL_MEMBER_THRESHOLD = 200
+MAX_PICK_DEADLINE_HOURS = 72
 
-def _resolve_contestant_tribe(season, contestant_id, week):
-    if week < 1:
-        week = 1
+LEADERBOARD_STATUSES = ["active", "eliminated", MEMBERSHIP_STATUS_WINNER]
 
-    effective_week = week - 1 if week > 1 else week
-    latest_week = -1
-    latest_entry = None
-    for entry in season["tribe_timeline"]:
-        entry_week = entry["week"]
-        if entry_week > effective_week:
-            continue
-        if entry_week >= latest_week:
-            latest_week = entry_week
-            latest_entry = entry
-
-    if not latest_entry:
-        return None, None
+logger = logging.getLogger(__name__)
 
-    for tribe in latest_entry["tribes"]:
-        members = tribe["members"]
-        if contestant_id in members:
-            return tribe.get("name") or None, tribe.get("color") or None
 
-    return None, None
+@dataclass
+class PoolScoreRecalculation:
+    pool_id: str
+    engine: str
+    active_members: int | None
+    matched_count: int | None
+    modified_count: int | None
+    duration_ms: float
 
 
-def _collect_contestant_advantages(season, contestant_id, current_week):
-    visible_week = current_week - 1 if current_week > 1 else 0
-    advantages = []
-    for advantage in season.get("advantages", []):
-        obtained_week = advantage.get("obtained_week")
-        if obtained_week is not None and obtained_week > visible_week:
-            continue
-        if advantage.get("contestant_id") != contestant_id:
-            continue
-        label = (
-            advantage.get("advantage_display_name")
-            or advantage.get("advantage_type")
-            or "Advantage"
-        )
-        acquisition_notes = advantage.get("acquisition_notes")
-        end_notes = advantage.get("end_notes")
-        end_week = advantage.get("end_week")
-        obtained_week = advantage.get("obtained_week")
-        value = acquisition_notes or end_notes or label
-        advantage_id = advantage.get("id") or f"{contestant_id}_{label}"
-        advantages.append(
-            ContestantAdvantage(
-                id=str(advantage_id),
-                label=str(label),
-                value=str(value),
-                acquisition_notes=(
-                    str(acquisition_notes) if acquisition_notes else None
-                ),
-                end_notes=str(end_notes) if end_notes else None,
-                end_week=end_week if isinstance(end_week, int) else None,
-                obtained_week=obtained_week if isinstance(obtained_week, int) else None,
-            )
-        )
-    return advantages
-
-
-def _collect_active_contestant_ids(season, week):
-    if week < 1:
-        week = 1
-
-    eliminated_before_week = {
-        elimination["eliminated_contestant_id"]
-        for elimination in season["eliminations"]
-        if elimination["eliminated_contestant_id"] and elimination["week"] < week
-    }
-
-    return {
-        contestant["id"]
-        for contestant in season["contestants"]
-        if contestant["id"] not in eliminated_before_week
-    }
-
-
-def _gather_used_contestants(pool_oid, upto_week):
+def _gather_used_masks(pool_oid, upto_week, season):
     if upto_week < 1:
         upto_week = 1
 
@@ -136,45 +88,457 @@ def _gather_used_contestants(pool_oid, upto_week):
 
     used = {}
     for pick in cursor:
-        used.setdefault(pick["userId"], set()).add(pick["contestant_id"])
+        member_user = pick["userId"]
+        used[member_user] = used.get(member_user, 0) | season.contestant_bit(
+            pick["contestant_id"]
+        )
 
     return used
 
 
-def _recalculate_pool_scores(pool_oid, season, target_week):
+def _membership_available_mask(membership, season):
+    mask = membership.get("available_mask")
+    if isinstance(mask, int):
+        return mask
+
+    legacy = membership.get("available_contestants")
+    if isinstance(legacy, list):
+        return season.contestant_mask(legacy)
+
+    return None
+
+
+def _recalculate_pool_scores(pool_oid, season, target_week, *, engine=None):
+    engine = engine or POOL_SCORE_ENGINE
+    if engine not in SCORE_ENGINES:
+        raise ValueError(f"Unknown score engine: {engine}")
+
+    started_at = perf_counter()
     if target_week < 1:
         target_week = 1
 
-    active_contestants = _collect_active_contestant_ids(season, target_week)
-    used_by_user = _gather_used_contestants(pool_oid, target_week)
+    if engine == SCORE_ENGINE_AGGREGATE:
+        active_members, matched_count, modified_count = _recalculate_in_database(
+            pool_oid, season, target_week
+        )
+    else:
+        active_members, matched_count, modified_count = _recalculate_in_python(
+            pool_oid, season, target_week
+        )
+
+    inactive_result = pool_memberships_collection.update_many(
+        {"poolId": pool_oid, "status": {"$ne": "active"}},
+        {"$set": {"available_mask": 0, "score": 0}},
+    )
+    if matched_count is not None:
+        matched_count += inactive_result.matched_count
+        modified_count += inactive_result.modified_count
+
+    season_leaderboard.refresh_pool_entries(season.id, pool_oid)
+    return _report_score_recalculation(
+        pool_oid, engine, active_members, matched_count, modified_count, started_at
+    )
+
+
+def _iter_python_scores(pool_oid, season, target_week):
+    active_mask = season.active_contestant_mask(target_week)
+    used_by_user = _gather_used_masks(pool_oid, target_week, season)
 
     active_cursor = pool_memberships_collection.find(
         {"poolId": pool_oid, "status": "active"},
         {"_id": 1, "userId": 1},
     )
-
     for membership in active_cursor:
-        membership_id = membership["_id"]
         member_user = membership["userId"]
-        remaining_ids = sorted(
-            active_contestants - used_by_user.get(member_user, set())
+        yield membership["_id"], active_mask & ~used_by_user.get(member_user, 0)
+
+
+def _recalculate_in_python(pool_oid, season, target_week):
+    active_members = 0
+    matched_count = 0
+    modified_count = 0
+    operations = []
+    for membership_id, remaining_mask in _iter_python_scores(
+        pool_oid, season, target_week
+    ):
+        active_members += 1
+        operations.append(
+            UpdateOne(
+                {"_id": membership_id},
+                {
+                    "$set": {
+                        "available_mask": remaining_mask,
+                        "score": remaining_mask.bit_count(),
+                    },
+                    "$unset": {"available_contestants": ""},
+                },
+            )
         )
-        pool_memberships_collection.update_one(
-            {"_id": membership_id},
+        if len(operations) >= SCORE_BULK_WRITE_CHUNK_SIZE:
+            result = pool_memberships_collection.bulk_write(operations, ordered=False)
+            matched_count += result.matched_count
+            modified_count += result.modified_count
+            operations = []
+
+    if operations:
+        result = pool_memberships_collection.bulk_write(operations, ordered=False)
+        matched_count += result.matched_count
+        modified_count += result.modified_count
+
+    return active_members, matched_count, modified_count
+
+
+def _score_pipeline(pool_oid, season, target_week):
+    active_contestants = sorted(season.active_contestant_ids(target_week))
+    mask_order = list(season.mask_order)
+
+    return [
+        {"$match": {"poolId": pool_oid, "status": "active"}},
+        {
+            "$lookup": {
+                "from": picks_collection.name,
+                "localField": "userId",
+                "foreignField": "userId",
+                "pipeline": [
+                    {"$match": {"poolId": pool_oid, "week": {"$lt": target_week}}},
+                    {
+                        "$group": {
+                            "_id": None,
+                            "contestant_ids": {"$addToSet": "$contestant_id"},
+                        }
+                    },
+                ],
+                "as": "used",
+            }
+        },
+        {
+            "$project": {
+                "_id": 1,
+                "remaining": {
+                    "$setDifference": [
+                        active_contestants,
+                        {"$ifNull": [{"$first": "$used.contestant_ids"}, []]},
+                    ]
+                },
+                "current_mask": "$available_mask",
+                "current_score": "$score",
+                "has_legacy_cache": {
+                    "$ne": [{"$type": "$available_contestants"}, "missing"]
+                },
+            }
+        },
+        {
+            "$project": {
+                "_id": 1,
+                "available_mask": {
+                    "$sum": {
+                        "$map": {
+                            "input": "$remaining",
+                            "as": "contestant_id",
+                            "in": {
+                                "$toLong": {
+                                    "$pow": [
+                                        2,
+                                        {
+                                            "$indexOfArray": [
+                                                mask_order,
+                                                "$$contestant_id",
+                                            ]
+                                        },
+                                    ]
+                                }
+                            },
+                        }
+                    }
+                },
+                "score": {"$size": "$remaining"},
+                "current_mask": 1,
+                "current_score": 1,
+                "has_legacy_cache": 1,
+            }
+        },
+    ]
+
+
+def _recalculate_in_database(pool_oid, season, target_week):
+    active_members = pool_memberships_collection.count_documents(
+        {"poolId": pool_oid, "status": "active"}
+    )
+    run_id = ObjectId()
+    pool_memberships_collection.aggregate(
+        [
+            *_score_pipeline(pool_oid, season, target_week),
             {
-                "$set": {
-                    "available_contestants": remaining_ids,
-                    "score": len(remaining_ids),
+                "$match": {
+                    "$expr": {
+                        "$or": [
+                            {"$ne": ["$available_mask", "$current_mask"]},
+                            {"$ne": ["$score", "$current_score"]},
+                            "$has_legacy_cache",
+                        ]
+                    }
+                }
+            },
+            {
+                "$merge": {
+                    "into": pool_memberships_collection.name,
+                    "on": "_id",
+                    "whenMatched": [
+                        {
+                            "$set": {
+                                "available_mask": "$$new.available_mask",
+                                "score": "$$new.score",
+                                "score_run_id": run_id,
+                            }
+                        },
+                        {"$unset": "available_contestants"},
+                    ],
+                    "whenNotMatched": "discard",
                 }
             },
+        ]
+    )
+    modified_count = pool_memberships_collection.count_documents(
+        {"poolId": pool_oid, "score_run_id": run_id}
+    )
+    return active_members, active_members, modified_count
+
+
+def check_score_engine_parity(season_id):
+    season_oid = parse_object_id(season_id, "season_id")
+    season = get_season_snapshot(season_oid)
+    if not season:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Season not found",
         )
 
-    pool_memberships_collection.update_many(
-        {"poolId": pool_oid, "status": {"$ne": "active"}},
-        {"$set": {"available_contestants": [], "score": 0}},
+    pools_checked = 0
+    members_checked = 0
+    mismatches = []
+    pools_cursor = pools_collection.find(
+        {"seasonId": season_oid, "deleted_at": None}, {"current_week": 1}
+    )
+    for pool in pools_cursor:
+        pools_checked += 1
+        target_week = max(pool.get("current_week", 1), 1)
+        python_masks = dict(_iter_python_scores(pool["_id"], season, target_week))
+        aggregate_rows = {
+            row["_id"]: row
+            for row in pool_memberships_collection.aggregate(
+                _score_pipeline(pool["_id"], season, target_week)
+            )
+        }
+
+        for membership_id in python_masks.keys() | aggregate_rows.keys():
+            members_checked += 1
+            python_mask = python_masks.get(membership_id)
+            python_score = None if python_mask is None else python_mask.bit_count()
+            row = aggregate_rows.get(membership_id, {})
+            aggregate_mask = row.get("available_mask")
+            aggregate_score = row.get("score")
+            if (python_mask, python_score) == (aggregate_mask, aggregate_score):
+                continue
+            mismatches.append(
+                ScoreEngineMismatch(
+                    pool_id=str(pool["_id"]),
+                    membership_id=str(membership_id),
+                    python_mask=python_mask,
+                    aggregate_mask=aggregate_mask,
+                    python_score=python_score,
+                    aggregate_score=aggregate_score,
+                )
+            )
+
+    return ScoreEngineParity(
+        season_id=season_id,
+        pools_checked=pools_checked,
+        members_checked=members_checked,
+        mismatches=mismatches,
+    )
+
+
+def _report_score_recalculation(
+    pool_oid, engine, active_members, matched_count, modified_count, started_at
+):
+    duration_ms = (perf_counter() - started_at) * 1000
+    metrics.increment(f"pool_scores.recalculations.{engine}")
+    metrics.observe(f"pool_scores.duration_ms.{engine}", duration_ms)
+    if active_members is not None:
+        metrics.observe("pool_scores.active_members", active_members)
+    if modified_count is not None:
+        metrics.observe("pool_scores.modified_count", modified_count)
+    if active_members is not None and active_members >= LARGE_POOL_MEMBER_THRESHOLD:
+        metrics.increment("pool_scores.large_pool_recalculations")
+        logger.warning(
+            "Pool %s score recalculation touched %d memberships (%d active) in %.1fms",
+            pool_oid,
+            matched_count,
+            active_members,
+            duration_ms,
+        )
+
+    return PoolScoreRecalculation(
+        pool_id=str(pool_oid),
+        engine=engine,
+        active_members=active_members,
+        matched_count=matched_count,
+        modified_count=modified_count,
+        duration_ms=duration_ms,
     )
 
 
+def _load_week_picks(pool_oid, week):
+    picks_cursor = picks_collection.find(
+        {"poolId": pool_oid, "week": week},
+        {"userId": 1, "contestant_id": 1},
+    )
+    return {pick.get("userId"): pick.get("contestant_id") for pick in picks_cursor}
+
+
+def _apply_advance_score_delta(pool_oid, season, eliminated_contestants, week_picks):
+    started_at = perf_counter()
+
+    pickers_by_contestant = {}
+    for user_id, contestant_id in week_picks.items():
+        pickers_by_contestant.setdefault(contestant_id, []).append(user_id)
+
+    operations = []
+    for contestant_id in eliminated_contestants:
+        bit = season.contestant_bit(contestant_id)
+        if not bit:
+            continue
+        operations.append(
+            UpdateMany(
+                {
+                    "poolId": pool_oid,
+                    "status": "active",
+                    "available_mask": {"$bitsAllSet": bit},
+                },
+                {
+                    "$bit": {"available_mask": {"and": ~bit}},
+                    "$inc": {"score": -1},
+                },
+            )
+        )
+    for contestant_id, user_ids in pickers_by_contestant.items():
+        bit = season.contestant_bit(contestant_id)
+        if not bit:
+            continue
+        operations.append(
+            UpdateMany(
+                {
+                    "poolId": pool_oid,
+                    "userId": {"$in": user_ids},
+                    "status": "active",
+                    "available_mask": {"$bitsAllSet": bit},
+                },
+                {
+                    "$bit": {"available_mask": {"and": ~bit}},
+                    "$inc": {"score": -1},
+                },
+            )
+        )
+
+    modified_count = 0
+    if operations:
+        result = pool_memberships_collection.bulk_write(operations, ordered=False)
+        modified_count = result.modified_count
+
+    season_leaderboard.refresh_pool_entries(season.id, pool_oid)
+    metrics.increment("pool_scores.incremental_updates")
+    metrics.observe("pool_scores.incremental_operations", len(operations))
+    metrics.observe(
+        "pool_scores.incremental_duration_ms", (perf_counter() - started_at) * 1000
+    )
+    return modified_count
+
+
+@dataclass
+class PoolAdvancePlan:
+    elimination_reasons: dict
+    winner_ids: list
+    pool_completed: bool
+    needs_full_recompute: bool
+
+
+def _plan_pool_advance(
+    season, current_week, eliminated_contestants, members, week_picks, is_competitive
+):
+    eliminated_mask = season.contestant_mask(eliminated_contestants)
+    is_final_week = season.final_week == current_week
+
+    elimination_reasons = {}
+    remaining_active = []
+    needs_full_recompute = False
+    for membership in members:
+        member_user = membership["userId"]
+        picked_contestant = week_picks.get(member_user)
+        picked_bit = season.contestant_bit(picked_contestant)
+
+        reason = None
+        if picked_contestant is None:
+            reason = ELIMINATION_REASON_MISSED_PICK
+        elif picked_bit & eliminated_mask:
+            reason = ELIMINATION_REASON_CONTESTANT
+        elif not is_final_week:
+            if not isinstance(membership.get("available_mask"), int):
+                needs_full_recompute = True
+            available_mask = _membership_available_mask(membership, season) or 0
+            if not available_mask & ~eliminated_mask & ~picked_bit:
+                reason = ELIMINATION_REASON_NO_OPTIONS
+
+        if reason:
+            elimination_reasons[member_user] = reason
+        else:
+            remaining_active.append(member_user)
+
+    winner_ids = []
+    if is_final_week:
+        winner_ids = remaining_active or list(elimination_reasons)
+    elif is_competitive:
+        if len(remaining_active) == 1:
+            winner_ids = remaining_active
+        elif not remaining_active:
+            winner_ids = list(elimination_reasons)
+
+    return PoolAdvancePlan(
+        elimination_reasons=elimination_reasons,
+        winner_ids=winner_ids,
+        pool_completed=bool(winner_ids),
+        needs_full_recompute=needs_full_recompute,
+    )
+
+
+def _apply_advance_eliminations(pool_oid, elimination_reasons, current_week, now):
+    ids_by_reason = {}
+    for member_id, reason in elimination_reasons.items():
+        ids_by_reason.setdefault(reason, []).append(member_id)
+
+    operations = [
+        UpdateMany(
+            {
+                "poolId": pool_oid,
+                "userId": {"$in": member_ids},
+                "status": "active",
+            },
+            {
+                "$set": {
+                    "status": "eliminated",
+                    "elimination_reason": reason,
+                    "eliminated_week": current_week,
+                    "eliminated_date": now,
+                    "score": 0,
+                    "available_mask": 0,
+                }
+            },
+        )
+        for reason, member_ids in ids_by_reason.items()
+    ]
+    if operations:
+        pool_memberships_collection.bulk_write(operations, ordered=False)
+
+
 def _maybe_mark_pool_competitive(pool_oid, pool_doc):
     if pool_doc.get("is_competitive"):
         return
@@ -209,24 +573,113 @@ def _mark_members_as_winners(pool_oid, winner_ids, finished_week, now):
                 "finished_date": now,
                 "final_rank": 1,
                 "score": 0,
-                "available_contestants": [],
+                "available_mask": 0,
             }
         },
     )
 
 
-def _load_winner_summaries(winner_ids):
+def _membership_username_fields(user_doc):
+    username = user_doc.get("username")
+    return {
+        "username": username,
+        "username_lower": username.lower() if username else "",
+    }
+
+
+def _resolve_member_usernames(memberships):
+    missing_ids = [
+        membership.get("userId")
+        for membership in memberships
+        if not membership.get("username")
+    ]
+    if missing_ids:
+        users_cursor = users_collection.find(
+            {"_id": {"$in": missing_ids}},
+            {"username": 1},
+        )
+        names_by_id = {user["_id"]: user.get("username") for user in users_cursor}
+        for membership in memberships:
+            if not membership.get("username"):
+                membership["username"] = names_by_id.get(membership.get("userId"))
+
+    return {
+        membership.get("userId"): membership.get("username")
+        for membership in memberships
+        if membership.get("username")
+    }
+
+
+def sync_membership_usernames(user_id=None):
+    selector = {}
+    if user_id is not None:
+        selector["_id"] = parse_object_id(user_id, "user_id")
+
+    users_scanned = 0
+    memberships_updated = 0
+    operations = []
+    for user in users_collection.find(selector, {"username": 1}):
+        users_scanned += 1
+        username = user.get("username")
+        if not username:
+            continue
+        username_lower = username.lower()
+        operations.append(
+            UpdateMany(
+                {
+                    "userId": user["_id"],
+                    "$or": [
+                        {"username": {"$ne": username}},
+                        {"username_lower": {"$ne": username_lower}},
+                    ],
+                },
+                {"$set": {"username": username, "username_lower": username_lower}},
+            )
+        )
+        if len(operations) >= SCORE_BULK_WRITE_CHUNK_SIZE:
+            result = pool_memberships_collection.bulk_write(operations, ordered=False)
+            memberships_updated += result.modified_count
+            operations = []
+
+    if user_id is None:
+        # Keyset paging sorts on the indexed username_lower, so no membership
+        # may be left without one.
+        operations.append(
+            UpdateMany({"username_lower": None}, {"$set": {"username_lower": ""}})
+        )
+    if operations:
+        result = pool_memberships_collection.bulk_write(operations, ordered=False)
+        memberships_updated += result.modified_count
+
+    logger.info(
+        "membership usernames synced users=%s memberships=%s",
+        users_scanned,
+        memberships_updated,
+    )
+    return PoolMembershipUsernameSync(
+        users_scanned=users_scanned,
+        memberships_updated=memberships_updated,
+    )
+
+
+def _load_pool_winner_summaries(pool_oid, winner_ids):
     if not winner_ids:
         return []
 
-    users_cursor = users_collection.find(
-        {"_id": {"$in": winner_ids}},
-        {"username": 1},
+    winner_memberships = list(
+        pool_memberships_collection.find(
+            {"poolId": pool_oid, "userId": {"$in": winner_ids}},
+            {"userId": 1, "username": 1},
+        )
     )
-    names_by_id = {}
-    for user in users_cursor:
-        label = user.get("username") or str(user.get("_id", ""))
-        names_by_id[user["_id"]] = label
+    return _load_winner_summaries(
+        winner_ids, _resolve_member_usernames(winner_memberships)
+    )
+
+
+def _load_winner_summaries(winner_ids, names_by_id):
+    if not winner_ids:
+        return []
 
     winners = []
     for winner_id in winner_ids:
@@ -237,6 +690,15 @@ def _load_winner_summaries(winner_ids):
     return winners
 
 
+def _require_week_deadline_ahead(season, settings, week):
+    deadline = deadlines.pick_deadline(season, settings, week)
+    if deadline is not None and deadlines.utc_now() >= deadline:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Pick deadline for week {week} has already passed",
+        )
+
+
 def create_pool(pool_data):
     name = pool_data.name.strip()
     if not name:
@@ -246,17 +708,17 @@ def create_pool(pool_data):
         )
 
     owner_id = parse_object_id(pool_data.owner_id, "owner_id")
-    if not users_collection.find_one({"_id": owner_id}):
+    owner = users_collection.find_one(
+        {"_id": owner_id, "deleted_at": None}, {"username": 1}
+    )
+    if not owner:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Owner not found",
         )
 
     season_id = parse_object_id(pool_data.season_id, "season_id")
-    season = seasons_collection.find_one(
-        {"_id": season_id},
-        {"contestants": 1, "eliminations": 1, "tribe_timeline": 1},
-    )
+    season = get_season_snapshot(season_id)
     if not season:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -270,6 +732,20 @@ def create_pool(pool_data):
             detail="Start week must be between 1 and 6",
         )
 
+    settings = {}
+    deadline_hours = pool_data.pick_deadline_hours
+    if deadline_hours is not None:
+        if deadline_hours < 0 or deadline_hours > MAX_PICK_DEADLINE_HOURS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=(
+                    f"Pick deadline must be between 0 and {MAX_PICK_DEADLINE_HOURS} "
+                    "hours"
+                ),
+            )
+        settings["pick_deadline_hours"] = deadline_hours
+        _require_week_deadline_ahead(season, settings, start_week)
+
     now = datetime.now()
     pool_doc = {
         "name": name,
@@ -278,7 +754,7 @@ def create_pool(pool_data):
         "created_at": now,
         "current_week": start_week,
         "start_week": start_week,
-        "settings": {},
+        "settings": settings,
         "status": POOL_STATUS_INVITE,
         "is_competitive": False,
         "competitive_since_week": None,
@@ -301,6 +777,7 @@ def create_pool(pool_data):
         {
             "poolId": pool_id,
             "userId": owner_id,
+            **_membership_username_fields(owner),
             "role": "owner",
             "joinedAt": now,
             "status": "active",
@@ -322,7 +799,10 @@ def create_pool(pool_data):
             continue
         seen_invites.add(invitee)
         invitee_id = parse_object_id(invitee, "invite_user_ids")
-        if not users_collection.find_one({"_id": invitee_id}):
+        invitee_user = users_collection.find_one(
+            {"_id": invitee_id, "deleted_at": None}, {"username": 1}
+        )
+        if not invitee_user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Invited user not found",
@@ -331,6 +811,7 @@ def create_pool(pool_data):
             {"poolId": pool_id, "userId": invitee_id},
             {
                 "$set": {
+                    **_membership_username_fields(invitee_user),
                     "role": "member",
                     "status": "invited",
                     "invitedAt": now,
@@ -377,11 +858,10 @@ def create_pool(pool_data):
     )
 
 
-def _build_member_summary(membership, user_doc):
-    raw_user_id = membership.get("userId") or user_doc.get("_id")
-    user_id = str(raw_user_id)
+def _build_member_summary(membership):
+    user_id = str(membership.get("userId"))
 
-    username = user_doc.get("username") or user_id
+    username = membership.get("username") or user_id
 
     return PoolMemberSummary(
         user_id=user_id,
@@ -403,7 +883,7 @@ def get_available_contestants(pool_id, user_id):
     pool_oid = parse_object_id(pool_id, "pool_id")
     user_oid = parse_object_id(user_id, "user_id")
 
-    pool = pools_collection.find_one({"_id": pool_oid})
+    pool = pools_collection.find_one({"_id": pool_oid, "deleted_at": None})
     if not pool:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -415,7 +895,7 @@ def get_available_contestants(pool_id, user_id):
     pool_completed_at = pool.get("completed_at")
 
     winner_ids = pool.get("winners", [])
-    winner_summaries = _load_winner_summaries(winner_ids) if winner_ids else []
+    winner_summaries = _load_pool_winner_summaries(pool_oid, winner_ids)
     did_tie = len(winner_summaries) > 1
 
     current_week = pool["current_week"]
@@ -429,13 +909,8 @@ def get_available_contestants(pool_id, user_id):
             detail="User is not a member of this pool",
         )
 
-    cache = membership.get("available_contestants")
     score_value = membership.get("score")
-    if not (
-        isinstance(cache, list)
-        and isinstance(score_value, int)
-        and score_value == len(cache)
-    ):
+    if not isinstance(score_value, int):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Available contestant cache invalid",
@@ -517,26 +992,27 @@ def get_available_contestants(pool_id, user_id):
             detail="Pool season not configured",
         )
 
-    season = seasons_collection.find_one(
-        {"_id": season_id},
-        {"contestants": 1, "tribe_timeline": 1},
-    )
+    season = get_season_snapshot(season_id)
     if not season:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Season not found",
         )
 
-    contestant_catalog = {
-        contestant["id"]: contestant for contestant in season["contestants"]
-    }
+    available_mask = _membership_available_mask(membership, season)
+    if available_mask is None or available_mask.bit_count() != score_value:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Available contestant cache invalid",
+        )
+
+    contestant_catalog = season.contestants_by_id
+    tribes = season.tribes_at(current_week)
 
     contestants = []
-    for contestant_id in cache:
+    for contestant_id in season.contestant_ids_from_mask(available_mask):
         contestant = contestant_catalog.get(contestant_id, {})
-        tribe_name, tribe_color = _resolve_contestant_tribe(
-            season, contestant_id, current_week
-        )
+        tribe_name, tribe_color = tribes.get(contestant_id, NO_TRIBE)
         contestants.append(
             AvailableContestantResponse(
                 id=contestant_id,
@@ -586,7 +1062,7 @@ def get_contestant_detail(pool_id, contestant_id, user_id):
     pool_oid = parse_object_id(pool_id, "pool_id")
     user_oid = parse_object_id(user_id, "user_id")
 
-    pool = pools_collection.find_one({"_id": pool_oid})
+    pool = pools_collection.find_one({"_id": pool_oid, "deleted_at": None})
     if not pool:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -615,24 +1091,14 @@ def get_contestant_detail(pool_id, contestant_id, user_id):
             detail="Pool season not configured",
         )
 
-    season = seasons_collection.find_one(
-        {"_id": season_id},
-        {
-            "contestants": 1,
-            "eliminations": 1,
-            "tribe_timeline": 1,
-            "advantages": 1,
-        },
-    )
+    season = get_season_snapshot(season_id)
     if not season:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Season not found",
         )
 
-    contestants_by_id = {
-        contestant["id"]: contestant for contestant in season["contestants"]
-    }
+    contestants_by_id = season.contestants_by_id
     target_contestant = contestants_by_id.get(contestant_id)
 
     if not target_contestant:
@@ -643,11 +1109,7 @@ def get_contestant_detail(pool_id, contestant_id, user_id):
 
     current_week = pool["current_week"]
 
-    eliminated_week = None
-    for elimination in season["eliminations"]:
-        if elimination.get("eliminated_contestant_id") == contestant_id:
-            eliminated_week = elimination["week"]
-            break
+    eliminated_week = season.elimination_week(contestant_id)
 
     prior_pick = picks_collection.find_one(
         {"userId": user_oid, "poolId": pool_oid, "contestant_id": contestant_id}
@@ -683,12 +1145,8 @@ def get_contestant_detail(pool_id, contestant_id, user_id):
         and membership.get("status") == "active"
     )
 
-    tribe_name, tribe_color = _resolve_contestant_tribe(
-        season, contestant_id, current_week
-    )
-    advantage_details = _collect_contestant_advantages(
-        season, contestant_id, current_week
-    )
+    tribe_name, tribe_color = season.tribe_for(contestant_id, current_week)
+    advantage_details = season.advantages_for(contestant_id, current_week)
 
     detail = ContestantDetail(
         id=contestant_id,
@@ -732,10 +1190,7 @@ def get_pool_advance_status(pool_id, user_id):
             detail="Pool season not configured",
         )
 
-    season = seasons_collection.find_one(
-        {"_id": season_id},
-        {"eliminations": 1, "final_week": 1},
-    )
+    season = get_season_snapshot(season_id)
     if not season:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -747,7 +1202,21 @@ def get_pool_advance_status(pool_id, user_id):
 
 
 def advance_pool_week(pool_id, payload):
-    pool, pool_oid, _ = _require_pool_owner(pool_id, payload.user_id)
+    pool, _, _ = _require_pool_owner(pool_id, payload.user_id)
+    return advance_pool(pool)
+
+
+def simulate_pool_advance(pool_id, payload):
+    pool, _, _ = _require_pool_owner(pool_id, payload.user_id)
+    return advance_pool(
+        pool,
+        dry_run=True,
+        eliminated_contestant_ids=payload.eliminated_contestant_ids,
+    )
+
+
+def advance_pool(pool, *, dry_run=False, eliminated_contestant_ids=None):
+    pool_oid = pool["_id"]
 
     if pool.get("status") == POOL_STATUS_INVITE:
         raise HTTPException(
@@ -762,9 +1231,6 @@ def advance_pool_week(pool_id, payload):
         )
 
     current_week = pool["current_week"]
-    elimination_reasons = {}
-    pool_completed = False
-    winner_ids = []
 
     season_id = pool.get("seasonId")
     if not season_id:
@@ -773,212 +1239,73 @@ def advance_pool_week(pool_id, payload):
             detail="Pool season not configured",
         )
 
-    season = seasons_collection.find_one(
-        {"_id": season_id},
-        {"contestants": 1, "eliminations": 1, "final_week": 1},
-    )
+    season = get_season_snapshot(season_id)
     if not season:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Season not found for pool",
         )
 
-    now = datetime.now()
-
-    status_payload, missing_ids = _compute_pool_advance_status(
-        pool_oid, current_week, season
-    )
-    if not status_payload.can_advance:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Next week data is not available yet",
-        )
-
-    missing_set = set(missing_ids)
-    if missing_set:
-        pool_memberships_collection.update_many(
-            {
-                "poolId": pool_oid,
-                "userId": {"$in": list(missing_set)},
-                "status": "active",
-            },
-            {
-                "$set": {
-                    "status": "eliminated",
-                    "elimination_reason": ELIMINATION_REASON_MISSED_PICK,
-                    "eliminated_week": current_week,
-                    "eliminated_date": now,
-                    "score": 0,
-                    "available_contestants": [],
-                }
-            },
-        )
-        for member_id in missing_set:
-            elimination_reasons[member_id] = ELIMINATION_REASON_MISSED_PICK
-
-    eliminated_contestants = [
-        elimination["eliminated_contestant_id"]
-        for elimination in season["eliminations"]
-        if elimination["week"] == current_week
-        and elimination["eliminated_contestant_id"]
-    ]
-
-    if eliminated_contestants:
-        losing_cursor = picks_collection.find(
-            {
-                "poolId": pool_oid,
-                "week": current_week,
-                "contestant_id": {"$in": eliminated_contestants},
-            },
-            {"userId": 1},
-        )
-        losing_ids = set()
-        for pick in losing_cursor:
-            user_id = pick.get("userId")
-            if user_id not in elimination_reasons:
-                losing_ids.add(user_id)
-
-        if losing_ids:
-            pool_memberships_collection.update_many(
-                {
-                    "poolId": pool_oid,
-                    "userId": {"$in": list(losing_ids)},
-                    "status": "active",
-                },
-                {
-                    "$set": {
-                        "status": "eliminated",
-                        "elimination_reason": ELIMINATION_REASON_CONTESTANT,
-                        "eliminated_week": current_week,
-                        "eliminated_date": now,
-                        "score": 0,
-                        "available_contestants": [],
-                    }
-                },
-            )
-        for member_id in losing_ids:
-            elimination_reasons[member_id] = ELIMINATION_REASON_CONTESTANT
-
-    is_final_week = season.get("final_week") == current_week
-    if not is_final_week:
-        next_week = current_week + 1
-
-        eligible_contestants = set()
-        eliminated_before_next = {
-            elimination["eliminated_contestant_id"]
-            for elimination in season["eliminations"]
-            if elimination["eliminated_contestant_id"]
-            and elimination["week"] < next_week
-        }
-        for contestant in season["contestants"]:
-            contestant_id = contestant["id"]
-            if contestant_id not in eliminated_before_next:
-                eligible_contestants.add(contestant_id)
-
-        picks_cursor = picks_collection.find(
-            {
-                "poolId": pool_oid,
-                "week": {"$lte": current_week},
-            },
-            {"userId": 1, "contestant_id": 1},
-        )
-        used_contestants = {}
-        for pick in picks_cursor:
-            pick_user = pick.get("userId")
-            pick_contestant = pick.get("contestant_id")
-            used_contestants.setdefault(pick_user, set()).add(pick_contestant)
-
-        no_option_ids = set()
-        active_cursor = pool_memberships_collection.find(
-            {"poolId": pool_oid, "status": "active"},
-            {"userId": 1},
-        )
-        for membership in active_cursor:
-            member_user = membership.get("userId")
-            if member_user in elimination_reasons:
-                continue
-            remaining_options = eligible_contestants - used_contestants.get(
-                member_user, set()
+    if eliminated_contestant_ids is None:
+        if not _season_allows_advance(season, current_week):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Next week data is not available yet",
             )
-            if not remaining_options:
-                no_option_ids.add(member_user)
-
-        if no_option_ids:
-            pool_memberships_collection.update_many(
-                {
-                    "poolId": pool_oid,
-                    "userId": {"$in": list(no_option_ids)},
-                    "status": "active",
-                },
-                {
-                    "$set": {
-                        "status": "eliminated",
-                        "elimination_reason": ELIMINATION_REASON_NO_OPTIONS,
-                        "eliminated_week": current_week,
-                        "eliminated_date": now,
-                        "score": 0,
-                        "available_contestants": [],
-                    }
-                },
+        eliminated_contestants = season.eliminated_in_week(current_week)
+    else:
+        unknown_ids = [
+            contestant_id
+            for contestant_id in eliminated_contestant_ids
+            if season.contestant(contestant_id) is None
+        ]
+        if unknown_ids:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown contestant: {unknown_ids[0]}",
             )
-            for member_id in no_option_ids:
-                elimination_reasons[member_id] = ELIMINATION_REASON_NO_OPTIONS
+        eliminated_contestants = list(dict.fromkeys(eliminated_contestant_ids))
 
-    if is_final_week:
-        active_after_cursor = pool_memberships_collection.find(
+    members = list(
+        pool_memberships_collection.find(
             {"poolId": pool_oid, "status": "active"},
-            {"userId": 1},
+            {
+                "userId": 1,
+                "username": 1,
+                "available_mask": 1,
+                "available_contestants": 1,
+            },
         )
-        remaining_active = []
-        for membership in active_after_cursor:
-            member_user = membership.get("userId")
-            remaining_active.append(member_user)
+    )
+    week_picks = _load_week_picks(pool_oid, current_week)
+    plan = _plan_pool_advance(
+        season,
+        current_week,
+        eliminated_contestants,
+        members,
+        week_picks,
+        bool(pool.get("is_competitive")),
+    )
 
-        if remaining_active:
-            pool_completed = True
-            winner_ids = remaining_active
-        elif elimination_reasons:
-            tie_ids = list(elimination_reasons)
-            if tie_ids:
-                pool_completed = True
-                winner_ids = tie_ids
-    elif pool.get("is_competitive"):
-        active_after_cursor = pool_memberships_collection.find(
-            {"poolId": pool_oid, "status": "active"},
-            {"userId": 1},
+    if dry_run:
+        new_week = current_week if plan.pool_completed else current_week + 1
+    else:
+        new_week = _commit_pool_advance(
+            pool_oid, season, current_week, eliminated_contestants, week_picks, plan
         )
-        remaining_active = []
-        for membership in active_after_cursor:
-            member_user = membership.get("userId")
-            remaining_active.append(member_user)
 
-        if len(remaining_active) == 1:
-            pool_completed = True
-            winner_ids = remaining_active
-        elif len(remaining_active) == 0 and elimination_reasons:
-            tie_ids = list(elimination_reasons)
-            if tie_ids:
-                pool_completed = True
-                winner_ids = tie_ids
-
-    update_filter = {
-        "_id": pool_oid,
-        "current_week": current_week,
-    }
+    return _build_pool_advance_response(plan, new_week, members)
 
-    seen_winners = set()
-    winner_list = []
-    if pool_completed and winner_ids:
-        for candidate in winner_ids:
-            if candidate not in seen_winners:
-                seen_winners.add(candidate)
-                winner_list.append(candidate)
 
-    if pool_completed and not winner_list:
-        pool_completed = False
+def _commit_pool_advance(
+    pool_oid, season, current_week, eliminated_contestants, week_picks, plan
+):
+    now = datetime.now()
+    _apply_advance_eliminations(pool_oid, plan.elimination_reasons, current_week, now)
+    pick_stats.freeze_week(pool_oid, current_week, now)
 
-    if pool_completed and winner_ids:
-        _mark_members_as_winners(pool_oid, winner_list, current_week, now)
+    if plan.pool_completed:
+        _mark_members_as_winners(pool_oid, plan.winner_ids, current_week, now)
 
         pools_collection.update_one(
             {"_id": pool_oid},
@@ -987,51 +1314,51 @@ def advance_pool_week(pool_id, payload):
                     "status": POOL_STATUS_COMPLETED,
                     "completed_week": current_week,
                     "completed_at": now,
-                    "winners": winner_list,
+                    "winners": plan.winner_ids,
                 }
             },
         )
 
-        new_week = current_week
         _recalculate_pool_scores(pool_oid, season, current_week)
-    else:
-        updated_pool = pools_collection.find_one_and_update(
-            update_filter,
-            {"$inc": {"current_week": 1}},
-            return_document=ReturnDocument.AFTER,
-        )
+        return current_week
 
-        if not updated_pool:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Pool week changed, retry",
-            )
+    updated_pool = pools_collection.find_one_and_update(
+        {"_id": pool_oid, "current_week": current_week},
+        {"$inc": {"current_week": 1}},
+        return_document=ReturnDocument.AFTER,
+    )
+
+    if not updated_pool:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Pool week changed, retry",
+        )
 
-        new_week = updated_pool["current_week"]
+    new_week = updated_pool["current_week"]
+    if plan.needs_full_recompute:
         _recalculate_pool_scores(pool_oid, season, new_week)
+    else:
+        _apply_advance_score_delta(pool_oid, season, eliminated_contestants, week_picks)
+    return new_week
+
+
+def _build_pool_advance_response(plan, new_week, members):
+    winner_ids = set(plan.winner_ids)
+    elimination_reasons = {
+        member_id: reason
+        for member_id, reason in plan.elimination_reasons.items()
+        if member_id not in winner_ids
+    }
 
-    if pool_completed and winner_list:
-        for member_id in list(elimination_reasons.keys()):
-            if member_id in seen_winners:
-                elimination_reasons.pop(member_id, None)
+    names_by_id = {}
+    if plan.winner_ids or elimination_reasons:
+        names_by_id = _resolve_member_usernames(members)
 
-    winner_summaries = _load_winner_summaries(winner_list)
+    winner_summaries = _load_winner_summaries(plan.winner_ids, names_by_id)
 
     eliminated_members = []
     if elimination_reasons:
-        eliminated_ids = list(elimination_reasons.keys())
-        users_cursor = users_collection.find(
-            {"_id": {"$in": eliminated_ids}},
-            {"username": 1},
-        )
-        names_by_id = {}
-        for user in users_cursor:
-            label = user.get("username") or str(user.get("_id", ""))
-            names_by_id[user["_id"]] = label
-
-        for member_id in eliminated_ids:
-            if member_id in seen_winners:
-                continue
+        for member_id in elimination_reasons:
             username = names_by_id.get(member_id, str(member_id))
             eliminated_members.append(
                 PoolEliminatedMember(
@@ -1046,16 +1373,31 @@ def advance_pool_week(pool_id, payload):
     return PoolAdvanceResponse(
         new_current_week=new_week,
         eliminations=eliminated_members,
-        pool_completed=pool_completed,
+        pool_completed=plan.pool_completed,
         winners=winner_summaries,
     )
 
 
-def get_pool_leaderboard(pool_id, user_id):
+POOL_LEADERBOARD_PROJECTION = {
+    "poolId": 1,
+    "userId": 1,
+    "username": 1,
+    "username_lower": 1,
+    "score": 1,
+    "status": 1,
+    "elimination_reason": 1,
+    "eliminated_week": 1,
+    "final_rank": 1,
+    "finished_week": 1,
+    "finished_date": 1,
+}
+
+
+def get_pool_leaderboard(pool_id, user_id, limit=None, cursor=None):
     pool_oid = parse_object_id(pool_id, "pool_id")
     user_oid = parse_object_id(user_id, "user_id")
 
-    pool = pools_collection.find_one({"_id": pool_oid})
+    pool = pools_collection.find_one({"_id": pool_oid, "deleted_at": None})
     if not pool:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1063,7 +1405,8 @@ def get_pool_leaderboard(pool_id, user_id):
         )
 
     viewer_membership = pool_memberships_collection.find_one(
-        {"poolId": pool_oid, "userId": user_oid}
+        {"poolId": pool_oid, "userId": user_oid},
+        {"status": 1},
     )
     if not viewer_membership:
         raise HTTPException(
@@ -1072,70 +1415,57 @@ def get_pool_leaderboard(pool_id, user_id):
         )
 
     viewer_status = viewer_membership.get("status") or ""
-    allowed_statuses = {"active", "eliminated", MEMBERSHIP_STATUS_WINNER}
-    if viewer_status not in allowed_statuses:
+    if viewer_status not in LEADERBOARD_STATUSES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Leaderboard only available to pool members",
         )
 
-    membership_docs = list(pool_memberships_collection.find({"poolId": pool_oid}))
+    after = leaderboards.decode_cursor(cursor) if cursor else None
+    membership_docs = list(
+        pool_memberships_collection.aggregate(
+            leaderboards.keyset_pipeline(
+                {"poolId": pool_oid, "status": {"$in": LEADERBOARD_STATUSES}},
+                after,
+                limit,
+                POOL_LEADERBOARD_PROJECTION,
+            )
+        )
+    )
 
-    user_ids = [membership.get("userId") for membership in membership_docs]
-    users_by_id = {}
-    if user_ids:
-        users_cursor = users_collection.find(
-            {"_id": {"$in": user_ids}},
-            {"username": 1},
+    next_cursor = None
+    if limit is not None and len(membership_docs) > limit:
+        membership_docs = membership_docs[:limit]
+        last_entry = membership_docs[-1]
+        position = (after["position"] if after else 0) + len(membership_docs)
+        next_cursor = leaderboards.encode_cursor(
+            last_entry, last_entry["rank"], position
         )
-        users_by_id = {user["_id"]: user for user in users_cursor}
 
-    winner_ids = pool.get("winners", [])
-    winner_summaries = _load_winner_summaries(winner_ids) if winner_ids else []
+    names_by_id = _resolve_member_usernames(membership_docs)
+
+    winner_summaries = _load_pool_winner_summaries(pool_oid, pool.get("winners", []))
     did_tie = len(winner_summaries) > 1
 
-    entry_payloads = []
+    entries = []
     for membership in membership_docs:
         member_id = membership.get("userId")
         status_value = membership.get("status") or "active"
-        if status_value not in allowed_statuses:
-            continue
-        user_doc = users_by_id.get(member_id, {})
-        username = user_doc.get("username") or str(member_id)
-        score_value = membership.get("score")
-        elimination_reason = membership.get("elimination_reason")
-        entry_payloads.append(
-            {
-                "user_id": str(member_id),
-                "username": username,
-                "score": score_value,
-                "status": status_value,
-                "is_winner": status_value == MEMBERSHIP_STATUS_WINNER,
-                "elimination_reason": elimination_reason,
-                "eliminated_week": membership.get("eliminated_week"),
-                "final_rank": membership.get("final_rank"),
-                "finished_week": membership.get("finished_week"),
-                "finished_date": membership.get("finished_date"),
-            }
-        )
-
-    entry_payloads.sort(
-        key=lambda entry: (
-            -entry["score"],
-            entry["username"].lower(),
+        entries.append(
+            PoolLeaderboardEntry(
+                rank=membership["rank"],
+                user_id=str(member_id),
+                username=names_by_id.get(member_id) or str(member_id),
+                score=membership.get("score"),
+                status=status_value,
+                is_winner=status_value == MEMBERSHIP_STATUS_WINNER,
+                elimination_reason=membership.get("elimination_reason"),
+                eliminated_week=membership.get("eliminated_week"),
+                final_rank=membership.get("final_rank"),
+                finished_week=membership.get("finished_week"),
+                finished_date=membership.get("finished_date"),
+            )
         )
-    )
-
-    last_score = None
-    current_rank = 0
-    for index, payload in enumerate(entry_payloads):
-        score_value = payload["score"]
-        if last_score is None or score_value != last_score:
-            current_rank = index + 1
-            last_score = score_value
-        payload["rank"] = current_rank
-
-    entries = [PoolLeaderboardEntry(**payload) for payload in entry_payloads]
 
     current_week = pool["current_week"]
     status_label = pool.get("status", POOL_STATUS_OPEN)
@@ -1149,33 +1479,31 @@ def get_pool_leaderboard(pool_id, user_id):
         entries=entries,
         winners=winner_summaries,
         did_tie=did_tie,
+        next_cursor=next_cursor,
     )
 
 
 def list_pool_memberships(pool_id, owner_id):
     _, pool_oid, _ = _require_pool_owner(pool_id, owner_id)
 
-    membership_docs = list(pool_memberships_collection.find({"poolId": pool_oid}))
+    membership_docs = list(
+        pool_memberships_collection.find(
+            {
+                "poolId": pool_oid,
+                "status": {"$ne": cascade.MEMBERSHIP_STATUS_DELETED},
+            }
+        )
+    )
     if not membership_docs:
         return PoolMembershipListResponse(pool_id=str(pool_oid), members=[])
 
-    user_ids = [membership.get("userId") for membership in membership_docs]
-    if not user_ids:
-        return PoolMembershipListResponse(pool_id=str(pool_oid), members=[])
-
-    users_cursor = users_collection.find(
-        {"_id": {"$in": user_ids}},
-        {"username": 1},
-    )
-    users_by_id = {user["_id"]: user for user in users_cursor}
+    _resolve_member_usernames(membership_docs)
 
-    summaries = []
-    for membership in membership_docs:
-        member_id = membership.get("userId")
-        user_doc = users_by_id.get(member_id)
-        if not user_doc:
-            continue
-        summaries.append(_build_member_summary(membership, user_doc))
+    summaries = [
+        _build_member_summary(membership)
+        for membership in membership_docs
+        if membership.get("username")
+    ]
 
     summaries.sort(
         key=lambda member: (
@@ -1192,7 +1520,7 @@ def get_pool_announcement(pool_id, user_id):
     pool_oid = parse_object_id(pool_id, "pool_id")
     user_oid = parse_object_id(user_id, "user_id")
 
-    pool = pools_collection.find_one({"_id": pool_oid})
+    pool = pools_collection.find_one({"_id": pool_oid, "deleted_at": None})
     if not pool:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1255,7 +1583,7 @@ def mark_pool_announcement_seen(pool_id, payload: PoolAnnouncementSeenRequest):
     pool_oid = parse_object_id(pool_id, "pool_id")
     user_oid = parse_object_id(payload.user_id, "user_id")
 
-    pool = pools_collection.find_one({"_id": pool_oid}, {"_id": 1})
+    pool = pools_collection.find_one({"_id": pool_oid, "deleted_at": None}, {"_id": 1})
     if not pool:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1301,7 +1629,7 @@ def invite_user_to_pool(pool_id, payload):
         )
 
     target_user = users_collection.find_one(
-        {"_id": invited_oid, "account_status": "active"},
+        {"_id": invited_oid, "account_status": "active", "deleted_at": None},
         {"username": 1},
     )
     if not target_user:
@@ -1324,6 +1652,7 @@ def invite_user_to_pool(pool_id, payload):
         {"poolId": pool_oid, "userId": invited_oid},
         {
             "$set": {
+                **_membership_username_fields(target_user),
                 "role": "member",
                 "status": "invited",
                 "invitedAt": now,
@@ -1343,34 +1672,25 @@ def invite_user_to_pool(pool_id, payload):
         return_document=ReturnDocument.AFTER,
     )
 
-    member = _build_member_summary(updated, target_user)
+    member = _build_member_summary(updated)
     return PoolInviteResponse(member=member)
 
 
 def delete_pool(pool_id, owner_id):
-    _, pool_oid, _ = _require_pool_owner(pool_id, owner_id)
+    pool, _, _ = _require_pool_owner(pool_id, owner_id)
 
-    picks_collection.delete_many({"poolId": pool_oid})
-    pool_memberships_collection.delete_many({"poolId": pool_oid})
-
-    delete_result = pools_collection.delete_one({"_id": pool_oid})
-    if delete_result.deleted_count != 1:
+    if cascade.tombstone_pool(pool) != 1:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Pool not found",
         )
 
-    users_collection.update_many(
-        {"default_pool": pool_oid},
-        {"$set": {"default_pool": None}},
-    )
-
 
 def respond_to_invite(pool_id, payload):
     pool_oid = parse_object_id(pool_id, "pool_id")
     user_oid = parse_object_id(payload.user_id, "user_id")
 
-    pool = pools_collection.find_one({"_id": pool_oid})
+    pool = pools_collection.find_one({"_id": pool_oid, "deleted_at": None})
     if not pool:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1384,10 +1704,7 @@ def respond_to_invite(pool_id, payload):
             detail="Pool season not configured",
         )
 
-    season = seasons_collection.find_one(
-        {"_id": season_id},
-        {"contestants": 1, "eliminations": 1},
-    )
+    season = get_season_snapshot(season_id)
     if not season:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1416,10 +1733,21 @@ def respond_to_invite(pool_id, payload):
             detail="Invite not found",
         )
 
+    user_doc = users_collection.find_one(
+        {"_id": user_oid, "deleted_at": None},
+        {"username": 1},
+    )
+    if not user_doc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found",
+        )
+
     now = datetime.now()
     if action == "accept":
         update_doc = {
             "$set": {
+                **_membership_username_fields(user_doc),
                 "status": "active",
                 "joinedAt": now,
                 "invitedAt": membership.get("invitedAt") or now,
@@ -1439,7 +1767,7 @@ def respond_to_invite(pool_id, payload):
                 "invitedAt": membership.get("invitedAt") or now,
                 "elimination_reason": None,
                 "score": 0,
-                "available_contestants": [],
+                "available_mask": 0,
                 "final_rank": None,
                 "finished_week": None,
                 "finished_date": None,
@@ -1457,22 +1785,12 @@ def respond_to_invite(pool_id, payload):
             detail="Invite already handled",
         )
 
-    user_doc = users_collection.find_one(
-        {"_id": user_oid},
-        {"username": 1},
-    )
-    if not user_doc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
-        )
-
     if action == "accept":
         current_week = pool["current_week"]
         _recalculate_pool_scores(pool_oid, season, current_week)
         _maybe_mark_pool_competitive(pool_oid, pool)
 
-    member = _build_member_summary(updated_membership, user_doc)
+    member = _build_member_summary(updated_membership)
     return PoolInviteDecisionResponse(member=member)
 
 
@@ -1491,7 +1809,7 @@ def get_pending_invites_for_user(user_id):
         return PendingInvitesResponse(invites=[])
 
     pools_cursor = pools_collection.find(
-        {"_id": {"$in": list(pool_ids)}},
+        {"_id": {"$in": list(pool_ids)}, "deleted_at": None},
         {"name": 1, "ownerId": 1, "seasonId": 1},
     )
     pools_by_id = {pool["_id"]: pool for pool in pools_cursor}
@@ -1581,19 +1899,22 @@ def start_pool(pool_id, payload):
             detail="Pool season not configured",
         )
 
-    season = seasons_collection.find_one(
-        {"_id": season_id},
-        {"contestants": 1, "eliminations": 1},
-    )
+    season = get_season_snapshot(season_id)
     if not season:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Season not found",
         )
 
+    # Members cannot pick once the deadline has passed, so opening the pool
+    # then would let the scheduler eliminate everyone for a missed pick.
+    _require_week_deadline_ahead(
+        season, pool.get("settings"), pool.get("current_week", 1)
+    )
+
     updated_pool = pools_collection.find_one_and_update(
         {"_id": pool_oid, "status": POOL_STATUS_INVITE},
-        {"$set": {"status": POOL_STATUS_OPEN}},
+        {"$set": {"status": POOL_STATUS_OPEN, "started_at": deadlines.utc_now()}},
         return_document=ReturnDocument.AFTER,
     )
     if not updated_pool:
@@ -1612,7 +1933,7 @@ def start_pool(pool_id, payload):
                 "eliminated_week": None,
                 "eliminated_date": None,
                 "score": 0,
-                "available_contestants": [],
+                "available_mask": 0,
                 "final_rank": None,
                 "finished_week": None,
                 "finished_date": None,
@@ -1659,7 +1980,7 @@ def _require_pool_owner(pool_id, user_id):
     pool_oid = parse_object_id(pool_id, "pool_id")
     owner_oid = parse_object_id(user_id, "user_id")
 
-    pool = pools_collection.find_one({"_id": pool_oid})
+    pool = pools_collection.find_one({"_id": pool_oid, "deleted_at": None})
     if not pool:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1675,25 +1996,23 @@ def _require_pool_owner(pool_id, user_id):
     return pool, pool_oid, owner_oid
 
 
+def _season_allows_advance(season, current_week):
+    return season.has_elimination(current_week) or season.final_week == current_week
+
+
 def _compute_pool_advance_status(pool_oid, current_week, season=None):
     can_advance = True
     if season is not None:
-        eliminations = season["eliminations"]
-        can_advance = (
-            any(
-                elimination["week"] == current_week
-                and elimination["eliminated_contestant_id"]
-                for elimination in eliminations
-            )
-            or season.get("final_week") == current_week
-        )
+        can_advance = _season_allows_advance(season, current_week)
 
-    active_cursor = pool_memberships_collection.find(
-        {"poolId": pool_oid, "status": "active"},
-        {"userId": 1},
+    active_members = list(
+        pool_memberships_collection.find(
+            {"poolId": pool_oid, "status": "active"},
+            {"userId": 1, "username": 1},
+        )
     )
 
-    active_user_ids = [membership.get("userId") for membership in active_cursor]
+    active_user_ids = [membership.get("userId") for membership in active_members]
 
     active_member_count = len(active_user_ids)
     if not active_user_ids:
@@ -1724,13 +2043,14 @@ def _compute_pool_advance_status(pool_oid, current_week, season=None):
 
     missing_members = []
     if missing_user_ids:
-        users_cursor = users_collection.find(
-            {"_id": {"$in": missing_user_ids}},
-            {"username": 1},
+        missing_set = set(missing_user_ids)
+        usernames = _resolve_member_usernames(
+            [
+                membership
+                for membership in active_members
+                if membership.get("userId") in missing_set
+            ]
         )
-        usernames = {}
-        for user in users_cursor:
-            usernames[user["_id"]] = user.get("username", "")
 
         for user_id in missing_user_ids:
             name = usernames.get(user_id, "") or str(user_id)
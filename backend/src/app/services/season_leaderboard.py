@@ -0,0 +1,234 @@
+import logging
+from bisect import bisect_right
+from datetime import UTC, datetime
+
+from fastapi import HTTPException, status
+from pymongo.errors import DuplicateKeyError
+
+from ..core.config import SEASON_LEADERBOARD_MERGE_ATTEMPTS, SEASON_LEADERBOARD_SIZE
+from ..db.mongo import (
+    pool_memberships_collection,
+    pools_collection,
+    season_leaderboards_collection,
+    seasons_collection,
+)
+from ..schemas.seasons import SeasonLeaderboardEntry, SeasonLeaderboardResponse
+from . import leaderboards
+from .common import parse_object_id
+
+SEASON_LEADERBOARD_PROJECTION = {
+    "poolId": 1,
+    "userId": 1,
+    "username": 1,
+    "username_lower": 1,
+    "score": 1,
+}
+
+logger = logging.getLogger(__name__)
+
+
+def _season_selector(pool_ids):
+    return {"poolId": {"$in": pool_ids}, "status": "active"}
+
+
+def _load_entries(selector, top_size):
+    entries = list(
+        pool_memberships_collection.aggregate(
+            leaderboards.keyset_pipeline(
+                selector, None, top_size, SEASON_LEADERBOARD_PROJECTION
+            )
+        )
+    )
+    return entries[:top_size], len(entries) > top_size
+
+
+def _assign_ranks(entries):
+    for index, entry in enumerate(entries):
+        if index and entries[index - 1]["score"] == entry["score"]:
+            entry["rank"] = entries[index - 1]["rank"]
+        else:
+            entry["rank"] = index + 1
+
+
+def refresh_season_leaderboard(season_oid):
+    read_at = datetime.now(UTC)
+    pool_names = {
+        pool["_id"]: pool.get("name") or ""
+        for pool in pools_collection.find(
+            {"seasonId": season_oid, "deleted_at": None}, {"name": 1}
+        )
+    }
+
+    top_size = max(SEASON_LEADERBOARD_SIZE, 1)
+    entries, truncated = [], False
+    if pool_names:
+        entries, truncated = _load_entries(_season_selector(list(pool_names)), top_size)
+    for entry in entries:
+        entry["pool_name"] = pool_names[entry["poolId"]]
+
+    board = {
+        "entries": entries,
+        "complete": not truncated,
+        "read_at": read_at,
+        "updated_at": datetime.now(UTC),
+    }
+    try:
+        season_leaderboards_collection.update_one(
+            {
+                "_id": season_oid,
+                "$or": [{"read_at": {"$lt": read_at}}, {"read_at": None}],
+            },
+            {"$set": board, "$inc": {"version": 1}},
+            upsert=True,
+        )
+    except DuplicateKeyError:
+        logger.info("season leaderboard %s already refreshed", season_oid)
+
+    return {"_id": season_oid, **board}
+
+
+def refresh_pool_entries(season_oid, pool_oid):
+    # A score write only moves one pool's memberships, so merge that pool's top
+    # entries into the cached board instead of re-ranking the whole season.
+    top_size = max(SEASON_LEADERBOARD_SIZE, 1)
+    for _ in range(SEASON_LEADERBOARD_MERGE_ATTEMPTS):
+        board = season_leaderboards_collection.find_one({"_id": season_oid})
+        cached = (board or {}).get("entries", [])
+        if board is None or not (board.get("complete") or cached):
+            return refresh_season_leaderboard(season_oid)
+
+        read_at = datetime.now(UTC)
+        pool = pools_collection.find_one(
+            {"_id": pool_oid, "deleted_at": None}, {"name": 1}
+        )
+        pool_entries, pool_truncated = [], False
+        if pool:
+            pool_entries, pool_truncated = _load_entries(
+                {"poolId": pool_oid, "status": "active"}, top_size
+            )
+        for entry in pool_entries:
+            entry["pool_name"] = pool.get("name") or ""
+
+        # Entries past either source's last known key may be missing members,
+        # so only the prefix both sources fully cover stays valid.
+        bounds = [leaderboards.sort_key(entry) for entry in pool_entries[-1:]]
+        bounds = bounds if pool_truncated else []
+        if not board.get("complete") and cached:
+            bounds.append(leaderboards.sort_key(cached[-1]))
+
+        entries = [entry for entry in cached if entry["poolId"] != pool_oid]
+        entries.extend(pool_entries)
+        entries.sort(key=leaderboards.sort_key)
+        if bounds:
+            bound = min(bounds)
+            entries = [
+                entry for entry in entries if leaderboards.sort_key(entry) <= bound
+            ]
+        complete = not bounds and len(entries) <= top_size
+        entries = entries[:top_size]
+        if not complete and len(entries) < top_size // 2:
+            return refresh_season_leaderboard(season_oid)
+        _assign_ranks(entries)
+
+        merged = {
+            "entries": entries,
+            "complete": complete,
+            "read_at": read_at,
+            "updated_at": datetime.now(UTC),
+        }
+        result = season_leaderboards_collection.update_one(
+            {"_id": season_oid, "version": board.get("version")},
+            {"$set": merged, "$inc": {"version": 1}},
+        )
+        if result.modified_count:
+            return {"_id": season_oid, **merged}
+
+    return refresh_season_leaderboard(season_oid)
+
+
+def get_season_leaderboard(season_id, limit, cursor=None):
+    season_oid = parse_object_id(season_id, "season_id")
+    if not seasons_collection.find_one({"_id": season_oid}, {"_id": 1}):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Season not found",
+        )
+
+    after = leaderboards.decode_cursor(cursor) if cursor else None
+
+    board = season_leaderboards_collection.find_one({"_id": season_oid})
+    if board is None:
+        board = refresh_season_leaderboard(season_oid)
+
+    cached = board.get("entries", [])
+    start = 0
+    if after is not None:
+        keys = [leaderboards.sort_key(entry) for entry in cached]
+        start = bisect_right(keys, leaderboards.sort_key(after))
+
+    page = [
+        {**entry, "position": index + 1}
+        for index, entry in enumerate(cached[start : start + limit + 1], start)
+    ]
+
+    remaining = limit + 1 - len(page)
+    if remaining > 0 and not board.get("complete"):
+        pool_ids = pools_collection.distinct(
+            "_id", {"seasonId": season_oid, "deleted_at": None}
+        )
+        tail_after = page[-1] if page else after
+        base_position = tail_after["position"] if tail_after else 0
+        tail = []
+        if pool_ids:
+            tail = pool_memberships_collection.aggregate(
+                leaderboards.keyset_pipeline(
+                    _season_selector(pool_ids),
+                    tail_after,
+                    remaining - 1,
+                    SEASON_LEADERBOARD_PROJECTION,
+                )
+            )
+        page.extend(
+            {**entry, "position": base_position + offset}
+            for offset, entry in enumerate(tail, 1)
+        )
+
+    unnamed_pool_ids = list(
+        {entry["poolId"] for entry in page if "pool_name" not in entry}
+    )
+    pool_names = {}
+    if unnamed_pool_ids:
+        pool_names = {
+            pool["_id"]: pool.get("name") or ""
+            for pool in pools_collection.find(
+                {"_id": {"$in": unnamed_pool_ids}, "deleted_at": None}, {"name": 1}
+            )
+        }
+
+    next_cursor = None
+    if len(page) > limit:
+        page = page[:limit]
+        last_entry = page[-1]
+        next_cursor = leaderboards.encode_cursor(
+            last_entry, last_entry["rank"], last_entry["position"]
+        )
+
+    entries = [
+        SeasonLeaderboardEntry(
+            rank=entry["rank"],
+            user_id=str(entry["userId"]),
+            username=entry.get("username") or str(entry["userId"]),
+            pool_id=str(entry["poolId"]),
+            pool_name=entry.get("pool_name", pool_names.get(entry["poolId"])),
+            score=entry["score"],
+        )
+        for entry in page
+        if "pool_name" in entry or entry["poolId"] in pool_names
+    ]
+
+    return SeasonLeaderboardResponse(
+        season_id=str(season_oid),
+        updated_at=board.get("updated_at"),
+        entries=entries,
+        next_cursor=next_cursor,
+    )
@@ -0,0 +1,317 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+from time import monotonic
+
+from ..core.config import (
+    SEASON_SNAPSHOT_CACHE_SIZE,
+    SEASON_SNAPSHOT_REVALIDATE_SECONDS,
+)
+from ..db.mongo import seasons_collection
+from ..schemas.pools import ContestantAdvantage
+
+SEASON_SNAPSHOT_PROJECTION = {
+    "season_number": 1,
+    "final_week": 1,
+    "air_date": 1,
+    "version": 1,
+    "contestants": 1,
+    "eliminations": 1,
+    "tribe_timeline": 1,
+    "advantages": 1,
+}
+
+
+NO_TRIBE = (None, None)
+MAX_MASK_CONTESTANTS = 63
+
+
+@dataclass(frozen=True)
+class TribeLookup:
+    assignments_by_week: tuple
+
+    def tribes_at(self, week):
+        if not self.assignments_by_week:
+            return {}
+
+        if week < 1:
+            week = 1
+
+        effective_week = week - 1 if week > 1 else week
+        last_index = len(self.assignments_by_week) - 1
+        return self.assignments_by_week[min(effective_week, last_index)]
+
+    def tribe_for(self, contestant_id, week):
+        return self.tribes_at(week).get(contestant_id, NO_TRIBE)
+
+
+def compile_tribe_lookup(tribe_timeline):
+    entries = []
+    for entry in tribe_timeline:
+        members = {}
+        for tribe in entry["tribes"]:
+            assignment = (tribe.get("name") or None, tribe.get("color") or None)
+            for member in tribe["members"]:
+                members.setdefault(member, assignment)
+        entries.append((int(entry["week"]), members))
+
+    if not entries:
+        return TribeLookup(assignments_by_week=())
+
+    entries.sort(key=lambda item: item[0])
+    last_week = max(entries[-1][0], 0)
+
+    assignments_by_week = []
+    current = {}
+    position = 0
+    for week in range(last_week + 1):
+        while position < len(entries) and entries[position][0] <= week:
+            current = entries[position][1]
+            position += 1
+        assignments_by_week.append(current)
+
+    return TribeLookup(assignments_by_week=tuple(assignments_by_week))
+
+
+@dataclass(frozen=True)
+class AdvantageIndex:
+    intervals_by_holder: dict
+    _visible_by_week: dict = field(default_factory=dict, compare=False, repr=False)
+
+    def advantages_at(self, week):
+        visible_week = week - 1 if week > 1 else 0
+        visible = self._visible_by_week.get(visible_week)
+        if visible is None:
+            visible = {}
+            for holder, intervals in self.intervals_by_holder.items():
+                advantages = tuple(
+                    advantage
+                    for obtained_week, _, advantage in intervals
+                    if obtained_week is None or obtained_week <= visible_week
+                )
+                if advantages:
+                    visible[holder] = advantages
+            self._visible_by_week[visible_week] = visible
+        return visible
+
+    def advantages_for(self, contestant_id, week):
+        return list(self.advantages_at(week).get(contestant_id, ()))
+
+
+def compile_advantage_index(advantages):
+    intervals_by_holder = {}
+    for advantage in advantages:
+        holder = advantage.get("contestant_id")
+        intervals_by_holder.setdefault(holder, []).append(
+            (
+                advantage.get("obtained_week"),
+                advantage.get("end_week"),
+                _build_contestant_advantage(advantage, holder),
+            )
+        )
+
+    return AdvantageIndex(
+        intervals_by_holder={
+            holder: tuple(intervals)
+            for holder, intervals in intervals_by_holder.items()
+        }
+    )
+
+
+def _build_contestant_advantage(advantage, contestant_id):
+    label = (
+        advantage.get("advantage_display_name")
+        or advantage.get("advantage_type")
+        or "Advantage"
+    )
+    acquisition_notes = advantage.get("acquisition_notes")
+    end_notes = advantage.get("end_notes")
+    end_week = advantage.get("end_week")
+    obtained_week = advantage.get("obtained_week")
+    value = acquisition_notes or end_notes or label
+    advantage_id = advantage.get("id") or f"{contestant_id}_{label}"
+    return ContestantAdvantage(
+        id=str(advantage_id),
+        label=str(label),
+        value=str(value),
+        acquisition_notes=str(acquisition_notes) if acquisition_notes else None,
+        end_notes=str(end_notes) if end_notes else None,
+        end_week=end_week if isinstance(end_week, int) else None,
+        obtained_week=obtained_week if isinstance(obtained_week, int) else None,
+    )
+
+
+@dataclass(frozen=True)
+class SeasonSnapshot:
+    id: object
+    version: int | None
+    season_number: int | None
+    final_week: int | None
+    air_date: object
+    contestant_ids: tuple
+    contestants_by_id: dict
+    mask_order: tuple
+    mask_bits: dict
+    elimination_week_by_contestant: dict
+    eliminations_by_week: dict
+    tribes: TribeLookup
+    advantages: AdvantageIndex
+
+    def contestant(self, contestant_id):
+        return self.contestants_by_id.get(contestant_id)
+
+    def contestant_name(self, contestant_id):
+        contestant = self.contestants_by_id.get(contestant_id) or {}
+        return contestant.get("name") or contestant_id
+
+    def elimination_week(self, contestant_id):
+        return self.elimination_week_by_contestant.get(contestant_id)
+
+    def eliminated_in_week(self, week):
+        return list(self.eliminations_by_week.get(week, ()))
+
+    def has_elimination(self, week):
+        return bool(self.eliminations_by_week.get(week))
+
+    def tribe_for(self, contestant_id, week):
+        return self.tribes.tribe_for(contestant_id, week)
+
+    def tribes_at(self, week):
+        return self.tribes.tribes_at(week)
+
+    def advantages_for(self, contestant_id, week):
+        return self.advantages.advantages_for(contestant_id, week)
+
+    def advantages_at(self, week):
+        return self.advantages.advantages_at(week)
+
+    def contestant_bit(self, contestant_id):
+        return self.mask_bits.get(contestant_id, 0)
+
+    def contestant_mask(self, contestant_ids):
+        mask = 0
+        for contestant_id in contestant_ids:
+            mask |= self.mask_bits.get(contestant_id, 0)
+        return mask
+
+    def contestant_ids_from_mask(self, mask):
+        return [
+            contestant_id
+            for position, contestant_id in enumerate(self.mask_order)
+            if mask >> position & 1
+        ]
+
+    def active_contestant_mask(self, week):
+        return self.contestant_mask(self.active_contestant_ids(week))
+
+    def active_contestant_ids(self, week):
+        if week < 1:
+            week = 1
+
+        eliminated_before_week = set()
+        for elimination_week, contestant_ids in self.eliminations_by_week.items():
+            if elimination_week < week:
+                eliminated_before_week.update(contestant_ids)
+
+        return {
+            contestant_id
+            for contestant_id in self.contestant_ids
+            if contestant_id not in eliminated_before_week
+        }
+
+
+def compile_season_snapshot(season):
+    contestants_by_id = {}
+    for contestant in season.get("contestants", []):
+        contestants_by_id.setdefault(contestant["id"], contestant)
+
+    elimination_week_by_contestant = {}
+    eliminations_by_week = {}
+    for elimination in season.get("eliminations", []):
+        contestant_id = elimination.get("eliminated_contestant_id")
+        if not contestant_id:
+            continue
+        week = int(elimination["week"])
+        elimination_week_by_contestant.setdefault(contestant_id, week)
+        eliminations_by_week.setdefault(week, []).append(contestant_id)
+
+    mask_order = tuple(sorted(contestants_by_id))
+    if len(mask_order) > MAX_MASK_CONTESTANTS:
+        raise ValueError(
+            f"Season {season['_id']} has more than {MAX_MASK_CONTESTANTS} contestants"
+        )
+
+    final_week = season.get("final_week")
+
+    return SeasonSnapshot(
+        id=season["_id"],
+        version=season.get("version"),
+        season_number=season.get("season_number"),
+        final_week=int(final_week) if final_week is not None else None,
+        air_date=season.get("air_date"),
+        contestant_ids=tuple(contestants_by_id),
+        contestants_by_id=contestants_by_id,
+        mask_order=mask_order,
+        mask_bits={
+            contestant_id: 1 << position
+            for position, contestant_id in enumerate(mask_order)
+        },
+        elimination_week_by_contestant=elimination_week_by_contestant,
+        eliminations_by_week={
+            week: tuple(contestant_ids)
+            for week, contestant_ids in eliminations_by_week.items()
+        },
+        tribes=compile_tribe_lookup(season.get("tribe_timeline", [])),
+        advantages=compile_advantage_index(season.get("advantages", [])),
+    )
+
+
+_snapshots = OrderedDict()
+_snapshots_lock = Lock()
+
+
+def get_season_snapshot(season_id):
+    with _snapshots_lock:
+        cached = _snapshots.get(season_id)
+        if cached is not None:
+            _snapshots.move_to_end(season_id)
+
+    if cached is not None:
+        snapshot, checked_at = cached
+        now = monotonic()
+        if now - checked_at < SEASON_SNAPSHOT_REVALIDATE_SECONDS:
+            return snapshot
+
+        current = seasons_collection.find_one({"_id": season_id}, {"version": 1})
+        if not current:
+            invalidate_season_snapshot(season_id)
+            return None
+
+        if current.get("version") == snapshot.version:
+            _store_snapshot(snapshot, now)
+            return snapshot
+
+    season = seasons_collection.find_one({"_id": season_id}, SEASON_SNAPSHOT_PROJECTION)
+    if not season:
+        invalidate_season_snapshot(season_id)
+        return None
+
+    snapshot = compile_season_snapshot(season)
+    _store_snapshot(snapshot, monotonic())
+    return snapshot
+
+
+def invalidate_season_snapshot(season_id=None):
+    with _snapshots_lock:
+        if season_id is None:
+            _snapshots.clear()
+        else:
+            _snapshots.pop(season_id, None)
+
+
+def _store_snapshot(snapshot, checked_at):
+    with _snapshots_lock:
+        _snapshots[snapshot.id] = (snapshot, checked_at)
+        _snapshots.move_to_end(snapshot.id)
+        while len(_snapshots) > max(SEASON_SNAPSHOT_CACHE_SIZE, 1):
+            _snapshots.popitem(last=False)
@@ -0,0 +1,223 @@
+from datetime import UTC, datetime, timedelta
+
+from bson import ObjectId
+from fastapi import HTTPException, status
+
+from ..core.config import PICK_STATS_WATERMARK_LAG_SECONDS
+from ..db.mongo import (
+    analytics_watermarks_collection,
+    picks_collection,
+    pools_collection,
+    season_pick_stats_collection,
+)
+from ..schemas.seasons import (
+    SeasonContestantPickStat,
+    SeasonPickStatsRefresh,
+    SeasonPickStatsResponse,
+    SeasonWeekPickStats,
+)
+from .common import parse_object_id
+from .season_snapshots import get_season_snapshot
+
+PICK_STATS_WATERMARK_ID = "season_pick_stats"
+
+
+def refresh_season_pick_stats():
+    state = analytics_watermarks_collection.find_one({"_id": PICK_STATS_WATERMARK_ID})
+    if state is None:
+        analytics_watermarks_collection.update_one(
+            {"_id": PICK_STATS_WATERMARK_ID},
+            {
+                "$setOnInsert": {
+                    "last_pick_id": None,
+                    "pending_pick_id": None,
+                    "updated_at": None,
+                }
+            },
+            upsert=True,
+        )
+        state = {"last_pick_id": None}
+
+    lower = state.get("last_pick_id")
+    upper = state.get("pending_pick_id")
+    if upper is None:
+        upper = ObjectId.from_datetime(
+            datetime.now(UTC) - timedelta(seconds=PICK_STATS_WATERMARK_LAG_SECONDS)
+        )
+        if lower is not None and upper <= lower:
+            return SeasonPickStatsRefresh(processed_from=str(lower), skipped=True)
+
+        # Pin the range first so a run that fails after a partial merge is
+        # resumed over exactly the same picks.
+        claimed = analytics_watermarks_collection.update_one(
+            {
+                "_id": PICK_STATS_WATERMARK_ID,
+                "last_pick_id": lower,
+                "pending_pick_id": None,
+            },
+            {"$set": {"pending_pick_id": upper}},
+        )
+        if not claimed.modified_count:
+            return SeasonPickStatsRefresh(
+                processed_from=str(lower) if lower else None, skipped=True
+            )
+
+    id_range = {"$lt": upper}
+    if lower is not None:
+        id_range["$gte"] = lower
+    _merge_pick_range(id_range, upper)
+
+    analytics_watermarks_collection.update_one(
+        {
+            "_id": PICK_STATS_WATERMARK_ID,
+            "last_pick_id": lower,
+            "pending_pick_id": upper,
+        },
+        {
+            "$set": {
+                "last_pick_id": upper,
+                "pending_pick_id": None,
+                "updated_at": datetime.now(),
+            }
+        },
+    )
+
+    return SeasonPickStatsRefresh(
+        processed_from=str(lower) if lower else None,
+        processed_to=str(upper),
+    )
+
+
+def _merge_pick_range(id_range, upper):
+    picks_collection.aggregate(
+        [
+            {"$match": {"_id": id_range}},
+            {
+                "$group": {
+                    "_id": {
+                        "poolId": "$poolId",
+                        "week": "$week",
+                        "contestant_id": "$contestant_id",
+                    },
+                    "pick_count": {"$sum": 1},
+                }
+            },
+            {
+                "$lookup": {
+                    "from": pools_collection.name,
+                    "localField": "_id.poolId",
+                    "foreignField": "_id",
+                    "pipeline": [
+                        {"$match": {"deleted_at": None}},
+                        {"$project": {"seasonId": 1}},
+                    ],
+                    "as": "pool",
+                }
+            },
+            {"$unwind": "$pool"},
+            {
+                "$group": {
+                    "_id": {
+                        "seasonId": "$pool.seasonId",
+                        "week": "$_id.week",
+                        "contestant_id": "$_id.contestant_id",
+                    },
+                    "pick_count": {"$sum": "$pick_count"},
+                }
+            },
+            {
+                "$project": {
+                    "seasonId": "$_id.seasonId",
+                    "week": "$_id.week",
+                    "contestant_id": "$_id.contestant_id",
+                    "pick_count": 1,
+                    "as_of_pick_id": upper,
+                }
+            },
+            {
+                "$merge": {
+                    "into": season_pick_stats_collection.name,
+                    "on": "_id",
+                    # A document that already carries this range's upper bound
+                    # was counted by an earlier attempt and is left alone.
+                    "whenMatched": [
+                        {
+                            "$set": {
+                                "pick_count": {
+                                    "$cond": [
+                                        {
+                                            "$lt": [
+                                                "$as_of_pick_id",
+                                                "$$new.as_of_pick_id",
+                                            ]
+                                        },
+                                        {"$add": ["$pick_count", "$$new.pick_count"]},
+                                        "$pick_count",
+                                    ]
+                                },
+                                "as_of_pick_id": {
+                                    "$max": ["$as_of_pick_id", "$$new.as_of_pick_id"]
+                                },
+                            }
+                        }
+                    ],
+                    "whenNotMatched": "insert",
+                }
+            },
+        ]
+    )
+
+
+def get_season_pick_stats(season_id):
+    season_oid = parse_object_id(season_id, "season_id")
+    season = get_season_snapshot(season_oid)
+    if not season:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Season not found",
+        )
+
+    stats_by_week = {}
+    cursor = season_pick_stats_collection.find(
+        {"seasonId": season_oid},
+        {"week": 1, "contestant_id": 1, "pick_count": 1},
+    )
+    for row in cursor:
+        week = row["week"]
+        contestant_id = row["contestant_id"]
+        pick_count = row.get("pick_count", 0)
+        eliminated_count = (
+            pick_count if season.elimination_week(contestant_id) == week else 0
+        )
+        stats_by_week.setdefault(week, []).append(
+            SeasonContestantPickStat(
+                contestant_id=contestant_id,
+                contestant_name=season.contestant_name(contestant_id),
+                pick_count=pick_count,
+                eliminated_count=eliminated_count,
+                survival_rate=(
+                    round(1 - eliminated_count / pick_count, 4) if pick_count else 1.0
+                ),
+            )
+        )
+
+    weeks = []
+    for week in sorted(stats_by_week):
+        contestants = stats_by_week[week]
+        contestants.sort(key=lambda stat: (-stat.pick_count, stat.contestant_name))
+        weeks.append(
+            SeasonWeekPickStats(
+                week=week,
+                total_picks=sum(stat.pick_count for stat in contestants),
+                contestants=contestants,
+            )
+        )
+
+    state = analytics_watermarks_collection.find_one(
+        {"_id": PICK_STATS_WATERMARK_ID}, {"updated_at": 1}
+    )
+    return SeasonPickStatsResponse(
+        season_id=str(season_oid),
+        updated_at=state.get("updated_at") if state else None,
+        weeks=weeks,
+    )
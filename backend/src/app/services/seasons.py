@@ -1,5 +1,24 @@
-from ..db.mongo import seasons_collection
-from ..schemas.seasons import SeasonResponse
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException, status
+
+from ..core.config import SEASON_ADVANCE_WORKERS
+from ..db.mongo import pools_collection, seasons_collection
+from ..schemas.seasons import (
+    SeasonAdvanceResponse,
+    SeasonPoolAdvanceResult,
+    SeasonResponse,
+)
+from . import pools as pools_service
+from .common import parse_object_id
+from .season_snapshots import get_season_snapshot
+
+SEASON_POOL_ADVANCED = "advanced"
+SEASON_POOL_SKIPPED = "skipped"
+SEASON_POOL_FAILED = "failed"
+
+logger = logging.getLogger(__name__)
 
 
 def list_seasons():
@@ -21,3 +40,59 @@ def list_seasons():
         )
         for season in seasons
     ]
+
+
+def advance_season_pools(season_id, week=None):
+    season_oid = parse_object_id(season_id, "season_id")
+    if not get_season_snapshot(season_oid):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Season not found",
+        )
+
+    query = {
+        "seasonId": season_oid,
+        "status": pools_service.POOL_STATUS_OPEN,
+        "deleted_at": None,
+    }
+    if week is not None:
+        query["current_week"] = week
+    pools = list(pools_collection.find(query))
+
+    with ThreadPoolExecutor(max_workers=max(SEASON_ADVANCE_WORKERS, 1)) as executor:
+        results = list(executor.map(_advance_season_pool, pools))
+
+    return SeasonAdvanceResponse(
+        season_id=str(season_oid),
+        week=week,
+        advanced_count=sum(r.status == SEASON_POOL_ADVANCED for r in results),
+        skipped_count=sum(r.status == SEASON_POOL_SKIPPED for r in results),
+        failed_count=sum(r.status == SEASON_POOL_FAILED for r in results),
+        pools=results,
+    )
+
+
+def _advance_season_pool(pool):
+    summary = {
+        "pool_id": str(pool["_id"]),
+        "pool_name": pool.get("name", ""),
+        "previous_week": pool.get("current_week", 1),
+    }
+    try:
+        result = pools_service.advance_pool(pool)
+    except HTTPException as exc:
+        outcome = (
+            SEASON_POOL_SKIPPED
+            if exc.status_code == status.HTTP_400_BAD_REQUEST
+            else SEASON_POOL_FAILED
+        )
+        return SeasonPoolAdvanceResult(**summary, status=outcome, detail=exc.detail)
+    except Exception:
+        logger.exception("Season advance failed for pool %s", pool["_id"])
+        return SeasonPoolAdvanceResult(
+            **summary, status=SEASON_POOL_FAILED, detail="Unexpected error"
+        )
+
+    return SeasonPoolAdvanceResult(
+        **summary, status=SEASON_POOL_ADVANCED, result=result
+    )
@@ -0,0 +1,136 @@
+import logging
+
+from ..db.mongo import user_search_grams_collection, users_collection
+from ..schemas.users import UserSearchIndexRebuild
+
+SEARCH_GRAM_SIZES = (2, 3)
+SEARCH_PROJECTION = {"_id": 1, "username": 1, "username_lower": 1}
+GRAM_PROJECTION = {"_id": 0, "userId": 1, "username": 1, "username_lower": 1}
+
+logger = logging.getLogger(__name__)
+
+
+def username_grams(username_lower):
+    grams = set()
+    for size in SEARCH_GRAM_SIZES:
+        for start in range(len(username_lower) - size + 1):
+            grams.add(username_lower[start : start + size])
+    return sorted(grams)
+
+
+def _gram_docs(user_doc):
+    username = user_doc.get("username") or ""
+    username_lower = username.lower()
+    return [
+        {
+            "gram": gram,
+            "userId": user_doc["_id"],
+            "username": username,
+            "username_lower": username_lower,
+            "account_status": user_doc.get("account_status", ""),
+        }
+        for gram in username_grams(username_lower)
+    ]
+
+
+def index_user(user_doc):
+    user_search_grams_collection.delete_many({"userId": user_doc["_id"]})
+    gram_docs = _gram_docs(user_doc)
+    if gram_docs:
+        user_search_grams_collection.insert_many(gram_docs, ordered=False)
+
+
+def remove_user(user_oid, session=None):
+    user_search_grams_collection.delete_many({"userId": user_oid}, session=session)
+
+
+def rebuild_user_search_index():
+    users_indexed = 0
+    grams_written = 0
+    projection = {"username": 1, "username_lower": 1, "account_status": 1}
+    for user_doc in users_collection.find({}, projection):
+        username = user_doc.get("username") or ""
+        if user_doc.get("username_lower") != username.lower():
+            users_collection.update_one(
+                {"_id": user_doc["_id"]},
+                {"$set": {"username_lower": username.lower()}},
+            )
+        index_user(user_doc)
+        users_indexed += 1
+        grams_written += len(username_grams(username.lower()))
+
+    logger.info(
+        "user search index rebuilt users=%s grams=%s", users_indexed, grams_written
+    )
+    return UserSearchIndexRebuild(
+        users_indexed=users_indexed,
+        grams_written=grams_written,
+    )
+
+
+def _prefix_upper_bound(prefix):
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def find_prefix_matches(normalized, limit):
+    cursor = (
+        users_collection.find(
+            {
+                "account_status": "active",
+                "username_lower": {
+                    "$gte": normalized,
+                    "$lt": _prefix_upper_bound(normalized),
+                },
+            },
+            SEARCH_PROJECTION,
+        )
+        .sort("username_lower", 1)
+        .limit(limit)
+    )
+    return [
+        {
+            "userId": doc["_id"],
+            "username": doc.get("username") or "",
+            "username_lower": doc.get("username_lower") or "",
+        }
+        for doc in cursor
+    ]
+
+
+def find_substring_matches(normalized, limit):
+    grams = [
+        gram
+        for gram in username_grams(normalized)
+        if len(gram) == min(len(normalized), max(SEARCH_GRAM_SIZES))
+    ]
+    if not grams or limit <= 0:
+        return []
+
+    gram_counts = list(
+        user_search_grams_collection.aggregate(
+            [
+                {"$match": {"gram": {"$in": grams}, "account_status": "active"}},
+                {"$group": {"_id": "$gram", "count": {"$sum": 1}}},
+                {"$sort": {"count": 1, "_id": 1}},
+            ]
+        )
+    )
+    # A gram no active user has rules out every match.
+    if len(gram_counts) < len(set(grams)):
+        return []
+
+    rarest_gram = gram_counts[0]["_id"]
+    cursor = user_search_grams_collection.find(
+        {"gram": rarest_gram, "account_status": "active"},
+        GRAM_PROJECTION,
+    ).sort("username_lower", 1)
+
+    matches = []
+    for doc in cursor:
+        username_lower = doc.get("username_lower") or ""
+        if normalized not in username_lower or username_lower.startswith(normalized):
+            continue
+        matches.append(doc)
+        if len(matches) >= limit:
+            break
+    return matches
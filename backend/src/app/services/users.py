@@ -1,11 +1,11 @@
-import re
+import asyncio
 import secrets
 from datetime import datetime, timedelta
 
 from fastapi import HTTPException, status
 from pymongo import ReturnDocument
 
-from ..core.email import send_password_reset_email, send_verification_email
+from ..core.auth import invalidate_authenticated_user
 from ..core.security import (
     DUMMY_PASSWORD_HASH,
     create_access_token,
@@ -13,7 +13,6 @@ from ..core.security import (
     verify_password,
 )
 from ..db.mongo import (
-    picks_collection,
     pool_memberships_collection,
     pools_collection,
     users_collection,
@@ -23,7 +22,7 @@ from ..schemas.users import (
     UserResponse,
     UserSearchResult,
 )
-from . import pools as pools_service
+from . import cascade, email_outbox, user_search
 from .common import parse_object_id
 
 MAX_FAILED_LOGIN_ATTEMPTS = 5
@@ -47,7 +46,13 @@ def _build_user_response(user, *, token=None):
     )
 
 
-def create_user(user_data, request):
+async def create_user(user_data, request):
+    await asyncio.to_thread(_ensure_new_user_available, user_data, request)
+    hashed_password = await hash_password(user_data.password)
+    return await asyncio.to_thread(_insert_user, user_data, hashed_password, request)
+
+
+def _ensure_new_user_available(user_data, request):
     if users_collection.find_one({"username": user_data.username}):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -56,7 +61,10 @@ def create_user(user_data, request):
 
     existing_email_user = users_collection.find_one({"email": user_data.email})
     if existing_email_user:
-        if existing_email_user.get("email_verified") is not True:
+        if (
+            existing_email_user.get("email_verified") is not True
+            and existing_email_user.get("deleted_at") is None
+        ):
             verification_token = secrets.token_urlsafe(32)
             updated_user = users_collection.find_one_and_update(
                 {"_id": existing_email_user["_id"]},
@@ -78,7 +86,9 @@ def create_user(user_data, request):
             verification_url = str(
                 request.url_for("verify_user_email", token=verification_token)
             )
-            send_verification_email(updated_user["email"], verification_url)
+            email_outbox.queue_verification_email(
+                updated_user["email"], verification_url
+            )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=(
@@ -92,11 +102,13 @@ def create_user(user_data, request):
             detail="Email already exists",
         )
 
-    hashed_password = hash_password(user_data.password)
+
+def _insert_user(user_data, hashed_password, request):
     verification_token = secrets.token_urlsafe(32)
 
     user_doc = {
         "username": user_data.username,
+        "username_lower": user_data.username.lower(),
         "email": user_data.email,
         "password_hash": hashed_password,
         "account_status": "active",
@@ -117,15 +129,16 @@ def create_user(user_data, request):
         )
 
     user_doc["_id"] = result.inserted_id
+    user_search.index_user(user_doc)
     verification_url = str(
         request.url_for("verify_user_email", token=verification_token)
     )
-    send_verification_email(user_doc["email"], verification_url)
+    email_outbox.queue_verification_email(user_doc["email"], verification_url)
     return _build_user_response(user_doc, token=None)
 
 
 def resend_verification_email(payload, request):
-    user = users_collection.find_one({"email": payload.email})
+    user = users_collection.find_one({"email": payload.email, "deleted_at": None})
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -159,10 +172,17 @@ def resend_verification_email(payload, request):
     verification_url = str(
         request.url_for("verify_user_email", token=verification_token)
     )
-    send_verification_email(updated_user["email"], verification_url)
+    email_outbox.queue_verification_email(updated_user["email"], verification_url)
+
 
+async def login_user(user_data):
+    user, now = await asyncio.to_thread(_load_login_user, user_data)
+    hashed_password = user["password_hash"] if user else DUMMY_PASSWORD_HASH
+    password_valid = await verify_password(user_data.password, hashed_password)
+    return await asyncio.to_thread(_finish_login, user, password_valid, now)
 
-def login_user(user_data):
+
+def _load_login_user(user_data):
     identifier = user_data.identifier.strip()
     if not identifier:
         raise HTTPException(
@@ -171,7 +191,10 @@ def login_user(user_data):
         )
 
     user = users_collection.find_one(
-        {"$or": [{"email": identifier}, {"username": identifier}]}
+        {
+            "$or": [{"email": identifier}, {"username": identifier}],
+            "deleted_at": None,
+        }
     )
     now = datetime.now()
 
@@ -194,12 +217,10 @@ def login_user(user_data):
             )
             user["failed_login_attempts"] = 0
             user["locked_until"] = None
-        hashed_password = user["password_hash"]
-    else:
-        hashed_password = DUMMY_PASSWORD_HASH
+    return user, now
 
-    password_valid = verify_password(user_data.password, hashed_password)
 
+def _finish_login(user, password_valid, now):
     if not user or not password_valid:
         response_status = status.HTTP_401_UNAUTHORIZED
         detail_message = "Incorrect username/email or password"
@@ -247,17 +268,27 @@ def login_user(user_data):
     return _build_user_response(user, token=token)
 
 
-def update_password(user_id, payload):
+async def update_password(user_id, payload):
+    user = await asyncio.to_thread(_load_password_update_user, user_id, payload)
+    if not await verify_password(payload.current_password, user["password_hash"]):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Current password is incorrect",
+        )
+
+    hashed_password = await hash_password(payload.new_password)
+    await asyncio.to_thread(_store_updated_password, user["_id"], hashed_password)
+
+
+def _load_password_update_user(user_id, payload):
     user_oid = parse_object_id(user_id, "user_id")
-    user = users_collection.find_one({"_id": user_oid})
+    user = users_collection.find_one({"_id": user_oid, "deleted_at": None})
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
 
-    hashed_password = user["password_hash"]
-
     if payload.new_password != payload.confirm_password:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -269,23 +300,21 @@ def update_password(user_id, payload):
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Password must be at least 6 characters",
         )
+    return user
 
-    if not verify_password(payload.current_password, hashed_password):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Current password is incorrect",
-        )
 
+def _store_updated_password(user_oid, hashed_password):
     updated_user = users_collection.find_one_and_update(
         {"_id": user_oid},
         {
             "$set": {
-                "password_hash": hash_password(payload.new_password),
+                "password_hash": hashed_password,
                 "token_invalidated_at": datetime.now(),
             }
         },
         return_document=ReturnDocument.AFTER,
     )
+    invalidate_authenticated_user(user_oid)
 
     if not updated_user:
         raise HTTPException(
@@ -302,7 +331,7 @@ def request_password_reset(payload):
             detail="Email is required",
         )
 
-    user = users_collection.find_one({"email": email})
+    user = users_collection.find_one({"email": email, "deleted_at": None})
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -315,10 +344,16 @@ def request_password_reset(payload):
         {"_id": user["_id"]},
         {"$set": {"reset_token": token, "reset_token_expires_at": expires_at}},
     )
-    send_password_reset_email(email, token)
+    email_outbox.queue_password_reset_email(email, token)
+
+
+async def complete_password_reset(payload):
+    user = await asyncio.to_thread(_load_password_reset_user, payload)
+    hashed_password = await hash_password(payload.new_password)
+    await asyncio.to_thread(_store_reset_password, user["_id"], hashed_password)
 
 
-def complete_password_reset(payload):
+def _load_password_reset_user(payload):
     token = payload.token.strip()
     if not token:
         raise HTTPException(
@@ -338,7 +373,7 @@ def complete_password_reset(payload):
             detail="Password must be at least 6 characters",
         )
 
-    user = users_collection.find_one({"reset_token": token})
+    user = users_collection.find_one({"reset_token": token, "deleted_at": None})
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -351,12 +386,15 @@ def complete_password_reset(payload):
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Reset token has expired",
         )
+    return user
 
+
+def _store_reset_password(user_oid, hashed_password):
     updated_user = users_collection.find_one_and_update(
-        {"_id": user["_id"]},
+        {"_id": user_oid},
         {
             "$set": {
-                "password_hash": hash_password(payload.new_password),
+                "password_hash": hashed_password,
                 "token_invalidated_at": datetime.now(),
             },
             "$unset": {
@@ -366,6 +404,7 @@ def complete_password_reset(payload):
         },
         return_document=ReturnDocument.AFTER,
     )
+    invalidate_authenticated_user(user_oid)
 
     if not updated_user:
         raise HTTPException(
@@ -377,7 +416,7 @@ def complete_password_reset(payload):
 def update_default_pool(user_id, payload):
     user_oid = parse_object_id(user_id, "user_id")
 
-    user = users_collection.find_one({"_id": user_oid})
+    user = users_collection.find_one({"_id": user_oid, "deleted_at": None})
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -388,7 +427,7 @@ def update_default_pool(user_id, payload):
         update_doc = {"$set": {"default_pool": None}}
     else:
         pool_oid = parse_object_id(payload.default_pool, "default_pool")
-        pool = pools_collection.find_one({"_id": pool_oid})
+        pool = pools_collection.find_one({"_id": pool_oid, "deleted_at": None})
         if not pool:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -408,7 +447,7 @@ def update_default_pool(user_id, payload):
 
     users_collection.update_one({"_id": user_oid}, update_doc)
 
-    updated_user = users_collection.find_one({"_id": user_oid})
+    updated_user = users_collection.find_one({"_id": user_oid, "deleted_at": None})
     if not updated_user:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -436,7 +475,7 @@ def list_user_pools(user_id):
     if not pool_ids:
         return []
 
-    pools = pools_collection.find({"_id": {"$in": list(pool_ids)}})
+    pools = pools_collection.find({"_id": {"$in": list(pool_ids)}, "deleted_at": None})
 
     responses = []
     for pool in pools:
@@ -482,7 +521,7 @@ def list_user_pools(user_id):
 
 def get_user_profile(user_id):
     user_oid = parse_object_id(user_id, "user_id")
-    user = users_collection.find_one({"_id": user_oid})
+    user = users_collection.find_one({"_id": user_oid, "deleted_at": None})
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -494,23 +533,16 @@ def get_user_profile(user_id):
 def delete_user(user_id):
     user_oid = parse_object_id(user_id, "user_id")
 
-    user = users_collection.find_one({"_id": user_oid})
+    user = users_collection.find_one({"_id": user_oid, "deleted_at": None})
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
 
-    owned_pools = list(pools_collection.find({"ownerId": user_oid}, {"_id": 1}))
-    for pool in owned_pools:
-        pool_id = pool["_id"]
-        pools_service.delete_pool(str(pool_id), user_id)
-
-    pool_memberships_collection.delete_many({"userId": user_oid})
-    picks_collection.delete_many({"userId": user_oid})
-
-    delete_result = users_collection.delete_one({"_id": user_oid})
-    if delete_result.deleted_count != 1:
+    tombstoned_count = cascade.tombstone_user(user_oid)
+    invalidate_authenticated_user(user_oid)
+    if tombstoned_count != 1:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete user",
@@ -524,7 +556,7 @@ def verify_user_email(token):
             detail="Verification token is required",
         )
 
-    user = users_collection.find_one({"verification_token": token})
+    user = users_collection.find_one({"verification_token": token, "deleted_at": None})
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -549,6 +581,7 @@ def verify_user_email(token):
         },
         return_document=ReturnDocument.AFTER,
     )
+    invalidate_authenticated_user(user["_id"])
 
     if not updated_user:
         raise HTTPException(
@@ -570,41 +603,35 @@ def search_active_users(query, pool_id=None, limit=10):
     pool_membership_status = {}
     if pool_id:
         pool_oid = parse_object_id(pool_id, "pool_id")
-        membership_cursor = pool_memberships_collection.find({"poolId": pool_oid})
+        membership_cursor = pool_memberships_collection.find(
+            {"poolId": pool_oid},
+            {"userId": 1, "status": 1},
+        )
         for membership in membership_cursor:
             member_id = membership.get("userId")
             pool_membership_status[member_id] = membership.get("status", "")
 
-    pattern = re.escape(trimmed)
-    selector = {
-        "account_status": "active",
-        "username": {"$regex": pattern, "$options": "i"},
-    }
-
-    projection = {"username": 1}
-    fetch_limit = max(effective_limit * 3, 30)
-    cursor = users_collection.find(selector, projection).limit(fetch_limit)
+    excluded_statuses = {"active", "invited", "eliminated"}
+    excluded_count = sum(
+        1 for status in pool_membership_status.values() if status in excluded_statuses
+    )
+    fetch_limit = effective_limit + excluded_count
 
-    ranked = []
-    for doc in cursor:
-        username = doc.get("username") or ""
-        if not username:
-            continue
-        lowered = username.lower()
-        rank = (
-            0 if lowered == normalized else 1 if lowered.startswith(normalized) else 2
+    matches = user_search.find_prefix_matches(normalized, fetch_limit)
+    if len(matches) < fetch_limit:
+        matches.extend(
+            user_search.find_substring_matches(normalized, fetch_limit - len(matches))
         )
-        ranked.append((rank, lowered, doc))
-
-    ranked.sort(key=lambda item: (item[0], item[1]))
 
     results = []
-    for _, _, doc in ranked:
-        user_id = doc["_id"]
+    for match in matches:
+        user_id = match["userId"]
         status = pool_membership_status.get(user_id)
-        if status in {"active", "invited", "eliminated"}:
+        if status in excluded_statuses:
+            continue
+        username = match["username"]
+        if not username:
             continue
-        username = doc.get("username") or ""
         results.append(
             UserSearchResult(
                 id=str(user_id),
@@ -25,6 +25,29 @@
     }
   }
 
+  // mirrors services/user_search.py: 2- and 3-character grams of the lowercased username
+  function indexUserSearch(userId, username, accountStatus) {
+    const usernameLower = username.toLowerCase();
+    const grams = new Set();
+    [2, 3].forEach((size) => {
+      for (let start = 0; start + size <= usernameLower.length; start += 1) {
+        grams.add(usernameLower.slice(start, start + size));
+      }
+    });
+    dbApp.user_search_grams.deleteMany({ userId });
+    if (grams.size) {
+      dbApp.user_search_grams.insertMany(
+        [...grams].sort().map((gram) => ({
+          gram,
+          userId,
+          username,
+          username_lower: usernameLower,
+          account_status: accountStatus
+        }))
+      );
+    }
+  }
+
   // helper to slugify names to ids
   function idOf(name) { return name.toLowerCase().replace(/[^a-z0-9]+/g, "_").replace(/^_|_$/g, ""); }
 
@@ -45,6 +68,11 @@
   const poolMemberships = dbApp.pool_memberships;
   const picks = dbApp.picks;
   const seasons = dbApp.seasons;
+  const schedulerLeases = dbApp.scheduler_leases;
+  const poolWeekPickStats = dbApp.pool_week_pick_stats;
+  const seasonPickStats = dbApp.season_pick_stats;
+  const userSearchGrams = dbApp.user_search_grams;
+  const emailOutbox = dbApp.email_outbox;
 
   const userValidator = {
     $jsonSchema: {
@@ -52,6 +80,7 @@
       required: ["username", "email", "password_hash", "account_status", "email_verified", "created_at"],
       properties: {
         username: { bsonType: "string" },
+        username_lower: { bsonType: "string" },
         email: { bsonType: "string" },
         password_hash: { bsonType: "string" },
         account_status: { bsonType: "string" },
@@ -65,7 +94,8 @@
         failed_login_attempts: { bsonType: ["int", "long"] },
         locked_until: { bsonType: ["date", "null"] },
         reset_token: { bsonType: ["string", "null"] },
-        reset_token_expires_at: { bsonType: ["date", "null"] }
+        reset_token_expires_at: { bsonType: ["date", "null"] },
+        deleted_at: { bsonType: ["date", "null"] }
       }
     }
   };
@@ -86,10 +116,12 @@
         is_competitive: { bsonType: "bool" },
         competitive_since_week: { bsonType: ["int", "long", "null"] },
         completed_week: { bsonType: ["int", "long", "null"] },
+        started_at: { bsonType: ["date", "null"] },
         completed_at: { bsonType: ["date", "null"] },
         winners: { bsonType: "array", items: { bsonType: "objectId" } },
         announcement_message: { bsonType: ["string", "null"] },
-        announcement_updated_at: { bsonType: ["date", "null"] }
+        announcement_updated_at: { bsonType: ["date", "null"] },
+        deleted_at: { bsonType: ["date", "null"] }
       }
     }
   };
@@ -101,6 +133,8 @@
       properties: {
         poolId: { bsonType: "objectId" },
         userId: { bsonType: "objectId" },
+        username: { bsonType: ["string", "null"] },
+        username_lower: { bsonType: ["string", "null"] },
         role: { bsonType: "string" },
         status: { bsonType: "string" },
         joinedAt: { bsonType: ["date", "null"] },
@@ -109,11 +143,14 @@
         elimination_reason: { bsonType: ["string", "null"] },
         eliminated_week: { bsonType: ["int", "long", "null"] },
         eliminated_date: { bsonType: ["date", "null"] },
+        available_mask: { bsonType: ["int", "long"] },
+        score_run_id: { bsonType: ["objectId", "null"] },
         available_contestants: { bsonType: "array", items: { bsonType: "string" } },
         score: { bsonType: ["int", "long"] },
         final_rank: { bsonType: ["int", "long", "null"] },
         finished_week: { bsonType: ["int", "long", "null"] },
-        finished_date: { bsonType: ["date", "null"] }
+        finished_date: { bsonType: ["date", "null"] },
+        deleted_at: { bsonType: ["date", "null"] }
       }
     }
   };
@@ -145,6 +182,7 @@
         location: { bsonType: "string" },
         format: { bsonType: "string" },
         final_week: { bsonType: ["int", "long", "double", "null"] },
+        version: { bsonType: ["int", "long"] },
         created_at: { bsonType: "date" },
         contestants: {
           bsonType: "array",
@@ -236,7 +274,8 @@
           tribe_timeline: seasonDoc.tribe_timeline,
           advantages: seasonDoc.advantages
         },
-        $setOnInsert: { created_at: now }
+        $setOnInsert: { created_at: now },
+        $inc: { version: 1 }
       },
       { upsert: true }
     );
@@ -245,6 +284,14 @@
   users.createIndex({ email: 1 }, { name: "users_email_unique", unique: true });
   users.createIndex({ username: 1 }, { name: "users_username_unique", unique: true });
   users.createIndex({ default_pool: 1 }, { name: "users_default_pool_idx" });
+  users.createIndex(
+    { deleted_at: 1 },
+    { name: "users_tombstone_idx", partialFilterExpression: { deleted_at: { $type: "date" } } }
+  );
+  users.createIndex(
+    { account_status: 1, username_lower: 1, _id: 1, username: 1 },
+    { name: "users_search_prefix_idx" }
+  );
   users.createIndex(
     { verification_token: 1 },
     {
@@ -270,6 +317,10 @@
 
   pools.createIndex({ ownerId: 1 }, { name: "pools_owner_idx" });
   pools.createIndex({ seasonId: 1 }, { name: "pools_season_idx" });
+  pools.createIndex(
+    { deleted_at: 1 },
+    { name: "pools_tombstone_idx", partialFilterExpression: { deleted_at: { $type: "date" } } }
+  );
 
   poolMemberships.createIndex(
     { poolId: 1, userId: 1 },
@@ -278,6 +329,10 @@
   poolMemberships.createIndex({ userId: 1 }, { name: "pool_memberships_user_idx" });
   poolMemberships.createIndex({ poolId: 1 }, { name: "pool_memberships_pool_idx" });
   poolMemberships.createIndex({ poolId: 1, status: 1 }, { name: "pool_memberships_pool_status_idx" });
+  poolMemberships.createIndex(
+    { poolId: 1, status: 1, score: -1, username_lower: 1, userId: 1 },
+    { name: "pool_memberships_leaderboard_idx" }
+  );
 
   picks.createIndex(
     { poolId: 1, userId: 1, week: 1 },
@@ -288,6 +343,51 @@
   picks.createIndex({ poolId: 1, contestant_id: 1 }, { name: "picks_pool_contestant_idx" });
   picks.createIndex({ result: 1 }, { name: "picks_result_idx" });
 
+  poolWeekPickStats.createIndex(
+    { poolId: 1, week: 1 },
+    { name: "pool_week_pick_stats_pool_week_unique", unique: true }
+  );
+
+  seasonPickStats.createIndex(
+    { seasonId: 1, week: 1 },
+    { name: "season_pick_stats_season_week_idx" }
+  );
+
+  userSearchGrams.createIndex(
+    { gram: 1, account_status: 1, username_lower: 1, userId: 1, username: 1 },
+    { name: "user_search_grams_lookup_idx" }
+  );
+  userSearchGrams.createIndex({ userId: 1 }, { name: "user_search_grams_user_idx" });
+
+  schedulerLeases.createIndex(
+    { expires_at: 1 },
+    { name: "scheduler_leases_expires_ttl", expireAfterSeconds: 0 }
+  );
+
+  emailOutbox.createIndex(
+    { status: 1, next_attempt_at: 1 },
+    { name: "email_outbox_status_due_idx" }
+  );
+  emailOutbox.createIndex(
+    { dedupe_key: 1 },
+    {
+      name: "email_outbox_pending_dedupe_unique",
+      unique: true,
+      partialFilterExpression: { status: "pending" }
+    }
+  );
+  emailOutbox.createIndex(
+    { claim_id: 1 },
+    {
+      name: "email_outbox_claim_idx",
+      partialFilterExpression: { claim_id: { $type: "string" } }
+    }
+  );
+  emailOutbox.createIndex(
+    { expires_at: 1 },
+    { name: "email_outbox_expires_ttl", expireAfterSeconds: 0 }
+  );
+
   const spacePasswordHash = process.env.SPACE_PASSWORD_HASH;
   if (!spacePasswordHash) {
     throw new Error("SPACE_PASSWORD_HASH is required");
@@ -318,6 +418,7 @@
     users.insertOne({
       _id: account.id,
       username: account.username,
+      username_lower: account.username.toLowerCase(),
       email: account.email,
       password_hash: spacePasswordHash,
       account_status: "active",
@@ -328,6 +429,7 @@
       verification_verified_at: now,
       verification_sent_at: now
     });
+    indexUserSearch(account.id, account.username, "active");
   });
 
   const resetUsername = "test";
@@ -359,10 +461,12 @@
     }
 
     users.deleteOne({ _id: testUserId });
+    userSearchGrams.deleteMany({ userId: testUserId });
   }
 
-  users.insertOne({
+  const resetUser = users.insertOne({
     username: resetUsername,
+    username_lower: resetUsername.toLowerCase(),
     email: "test@email.com",
     password_hash: spacePasswordHash,
     account_status: "active",
@@ -374,4 +478,5 @@
     verification_verified_at: now,
     verification_sent_at: now
   });
+  indexUserSearch(resetUser.insertedId, resetUsername, "active");
 })();